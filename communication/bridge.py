@@ -3,59 +3,283 @@
 import socket
 import threading
 import time
-from queue import Queue
+from collections import deque
+from queue import Queue, Empty
+import numpy as np
+from communication.commands import CommandHandler
+from communication.scheduler import CommandScheduler, PRIORITY_COMMANDS
+from communication.fusion import FleetKalmanFilter, parse_tello_state, measurement_arrays
+from utils.tracing import tracer
+
+# Seconds to wait for the real drone to answer a command
+REPLY_TIMEOUT = 30.0
 
 class TelloBridge:
-    def __init__(self, simulator):
+    def __init__(self, simulator, telemetry=None):
         self.simulator = simulator
+        self.telemetry = telemetry             # optional TelemetryStore fed by the monitor loop
+        self.handler = CommandHandler(simulator)
+        self.sim_lock = threading.RLock()      # the twin is shared by every thread
         self.real_drone = None
-        self.command_queue = Queue()
+        self.drone_address = ('192.168.10.1', 8889)
+        
+        # Tello replies carry no id, so they are matched to senders in send order
+        self.udp_lock = threading.Lock()
+        self.udp_waiters = deque()
+        self.command_queue = CommandScheduler()
         self.response_queue = Queue()
+        self.fusion = FleetKalmanFilter([self.command_queue.default_drone])
+        self.last_sync = None
+        self.sync_metrics = None
+        self.divergences = 0
+        
+        # Latest-value-wins rc channel
+        self.rc_lock = threading.Lock()
+        self.rc_ready = threading.Event()
+        self.rc_pending = None
+        self.rc_seq = 0
+        self.rc_stats = {
+            'sent': 0,
+            'superseded': 0,
+            'last_seq': 0,
+            'latency': deque(maxlen=100)
+        }
         
-    def connect_real_drone(self, ip="192.168.10.1", port=8889):
+    def connect_real_drone(self, ip="192.168.10.1", port=8889, local_port=8890):
         """Connect to real Tello drone"""
         try:
             self.real_drone = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.real_drone.bind(('', 8890))
-            self.real_drone.sendto(b'command', (ip, port))
+            self.real_drone.bind(('', local_port))
+            self.drone_address = (ip, port)
+            self.real_drone.sendto(b'command', self.drone_address)
             response = self.real_drone.recvfrom(1024)[0]
-            return response.decode('utf-8') == 'ok'
         except Exception as e:
             print(f"Connection error: {e}")
             return False
+        
+        # From here on only the receiver thread reads the socket
+        threading.Thread(target=self._receive_replies, daemon=True).start()
+        return response.decode('utf-8') == 'ok'
+        
+    def _receive_replies(self):
+        """Hand each reply from the drone to the oldest waiting sender"""
+        while True:
+            try:
+                reply = self.real_drone.recvfrom(1024)[0].decode()
+            except OSError:
+                return
+            with self.udp_lock:
+                on_reply = self.udp_waiters.popleft() if self.udp_waiters else None
+            if on_reply is not None:
+                on_reply(reply)
+                
+    def _udp_send(self, command, on_reply=None):
+        """
+        Send to the real drone; on_reply(reply) runs on the receiver thread.
+        Replies are matched in send order, so when a priority command is
+        answered before an earlier move, the two replies trade places, but
+        every sender still waits for exactly one reply.
+        """
+        with self.udp_lock:
+            if on_reply is not None:
+                self.udp_waiters.append(on_reply)
+            try:
+                self.real_drone.sendto(command.encode(), self.drone_address)
+            except OSError:
+                if on_reply is not None:
+                    self.udp_waiters.pop()
+                raise
+                
+    def _roundtrip(self, command):
+        """Send to the real drone and wait for its reply"""
+        replies = Queue()
+        try:
+            self._udp_send(command, replies.put)
+            return replies.get(timeout=REPLY_TIMEOUT)
+        except Empty:
+            return "Error: no reply"
+        except OSError as e:
+            return f"Error: {e}"
+            
+    def _execute_in_simulator(self, command):
+        verb, _, params = command.partition(' ')
+        with tracer.span('simulator.execute', command=command), self.sim_lock:
+            return self.handler.execute_command(verb, params or None)
             
     def send_command(self, command):
         """Send command to both simulator and real drone"""
-        # Execute in simulator
-        sim_response = self.simulator.execute_command(command)
+        with tracer.span('bridge.send_command', command=command):
+            sim_response = self._execute_in_simulator(command)
+            
+            # If real drone connected, send command
+            real_response = None
+            if self.real_drone:
+                with tracer.span('udp.roundtrip', command=command):
+                    real_response = self._roundtrip(command)
+                    
+        return {
+            'simulator': sim_response,
+            'real_drone': real_response
+        }
+
+    def set_rc(self, roll, pitch, throttle, yaw):
+        """Set rc stick values; replaces any value not yet sent"""
+        sticks = (roll, pitch, throttle, yaw)
+        if not all(self.handler._validate_rc(value) for value in sticks):
+            raise ValueError(f"Invalid rc values: {sticks}")
+        with self.rc_lock:
+            self.rc_seq += 1
+            if self.rc_pending is not None:
+                self.rc_stats['superseded'] += 1
+            self.rc_pending = (self.rc_seq, (roll, pitch, throttle, yaw), time.perf_counter())
+        self.rc_ready.set()
+        return self.rc_seq
+        
+    def flush_rc(self):
+        """Send the latest rc value to simulator and real drone without waiting for a reply"""
+        with self.rc_lock:
+            pending = self.rc_pending
+            self.rc_pending = None
+            self.rc_ready.clear()
+        if pending is None:
+            return None
+            
+        seq, sticks, set_time = pending
+        command = "rc {} {} {} {}".format(*sticks)
         
-        # If real drone connected, send command
-        real_response = None
+        # Actuate in simulator
+        with self.sim_lock:
+            self.simulator.set_rc(*sticks)
+        
+        # Fire and forget to real drone, rc has no response
         if self.real_drone:
             try:
-                self.real_drone.sendto(command.encode(), ('192.168.10.1', 8889))
-                real_response = self.real_drone.recvfrom(1024)[0].decode()
+                self._udp_send(command)
             except Exception as e:
-                real_response = f"Error: {e}"
+                print(f"RC send error: {e}")
+                
+        latency = time.perf_counter() - set_time
+        with self.rc_lock:
+            self.rc_stats['sent'] += 1
+            self.rc_stats['last_seq'] = seq
+            self.rc_stats['latency'].append(latency)
+        return seq
+        
+    def start_rc_stream(self, rate=20):
+        """Stream rc values as they change, at most rate times per second"""
+        def rc_loop():
+            while True:
+                self.rc_ready.wait()
+                self.flush_rc()
+                time.sleep(1 / rate)
                 
+        threading.Thread(target=rc_loop, daemon=True).start()
+        
+    def get_rc_latency(self):
+        """Command-to-actuation latency of the rc channel in milliseconds"""
+        with self.rc_lock:
+            latency = sorted(self.rc_stats['latency'])
+            stats = dict(self.rc_stats)
+        if not latency:
+            return None
         return {
-            'simulator': sim_response,
-            'real_drone': real_response
+            'sent': stats['sent'],
+            'superseded': stats['superseded'],
+            'last_seq': stats['last_seq'],
+            'mean_ms': sum(latency) / len(latency) * 1000,
+            'p95_ms': latency[int(0.95 * (len(latency) - 1))] * 1000,
+            'max_ms': latency[-1] * 1000
         }
+
+    def queue_command(self, command, drone_id=None):
+        """Queue a command for the dispatch loop; rc goes to the rc channel"""
+        parts = command.split()
+        if parts and parts[0] == 'rc':
+            # The Tello never answers rc, so it must not wait for a reply in the queue
+            if len(parts) != 5:
+                raise ValueError(f"rc takes 4 values, got '{command}'")
+            return self.set_rc(*(int(value) for value in parts[1:]))
+        self.command_queue.put(command, drone_id)
+
+    def dispatch_pending(self, timeout=None, priority=None):
+        """
+        Send every command that is ready and collect the responses.
+        priority=True/False limits this to the priority or regular lane.
+        Failures are reported on the response queue instead of raised.
+        """
+        ready = self.command_queue.get_ready(timeout, priority)
+        for drone_id, command, enqueued_at, dequeued_at in ready:
+            if tracer.enabled:
+                tracer.record('bridge.queue_wait', enqueued_at, dequeued_at,
+                              command=command, drone_id=drone_id)
+            if self.real_drone and command.split(' ')[0] in PRIORITY_COMMANDS:
+                self._dispatch_without_waiting(drone_id, command)
+                continue
+            try:
+                response = self.send_command(command)
+            except Exception as e:
+                response = {'error': f"{type(e).__name__}: {e}"}
+            finally:
+                self.command_queue.mark_done(drone_id)
+            self._respond(drone_id, command, response)
+            
+    def _dispatch_without_waiting(self, drone_id, command):
+        """Send a priority command and finish it when the reply arrives"""
+        try:
+            with tracer.span('bridge.send_command', command=command):
+                sim_response = self._execute_in_simulator(command)
+                
+                def finish(real_response):
+                    self.command_queue.mark_done(drone_id)
+                    self._respond(drone_id, command, {
+                        'simulator': sim_response,
+                        'real_drone': real_response
+                    })
+                self._udp_send(command, finish)
+        except Exception as e:
+            self.command_queue.mark_done(drone_id)
+            self._respond(drone_id, command, {'error': f"{type(e).__name__}: {e}"})
+            
+    def _respond(self, drone_id, command, response):
+        self.response_queue.put({
+            'drone_id': drone_id,
+            'command': command,
+            'response': response
+        })
+
+    def start_command_dispatch(self):
+        """
+        Start sending queued commands as each drone becomes idle.
+        The priority lane has its own thread and doesn't wait for replies,
+        so emergency/land/stop never wait behind a move's UDP reply.
+        """
+        def dispatch_loop(priority):
+            while True:
+                try:
+                    self.dispatch_pending(timeout=0.1, priority=priority)
+                except Exception as e:
+                    self.response_queue.put({'error': f"{type(e).__name__}: {e}"})
+                    time.sleep(0.1)
+
+        for priority in (False, True):
+            threading.Thread(target=dispatch_loop, args=(priority,), daemon=True).start()
         
     def start_state_monitoring(self):
         """Start monitoring state changes in both simulator and real drone"""
         def monitor_loop():
             while True:
-                # Get simulator state
-                sim_state = self.simulator.get_state_dict()
+                # Get simulator state, stamped with the twin's clock
+                with self.sim_lock:
+                    sim_state = self.simulator.get_state_dict()
+                    now = self.simulator.clock.time()
+                if self.telemetry is not None:
+                    self.telemetry.add_sample(sim_state, now)
+                real_state = None
                 
                 # If real drone connected, get its state
                 if self.real_drone:
-                    try:
-                        self.real_drone.sendto(b'state?', ('192.168.10.1', 8889))
-                        real_state = self.real_drone.recvfrom(1024)[0].decode()
-                    except:
+                    real_state = self._roundtrip('state?')
+                    if real_state.startswith('Error'):
                         real_state = None
                         
                 # Compare and synchronize states
@@ -67,7 +291,39 @@ class TelloBridge:
         
     def synchronize_states(self, sim_state, real_state):
         """Synchronize states between simulator and real drone"""
-        if real_state:
-            # Parse real drone state and update simulator
-            # This ensures digital twin matches physical drone
-            pass
\ No newline at end of file
+        if not real_state:
+            return None
+
+        # Parse real drone state and fuse it with the twin's dead reckoning
+        measurement = parse_tello_state(real_state)
+        if not measurement:
+            return None
+
+        # The twin's clock, so virtual-time runs predict over virtual time
+        now = self.simulator.clock.time()
+        dt = 0.0 if self.last_sync is None else now - self.last_sync
+        self.last_sync = now
+
+        # The twin already flew the last dt seconds, so its pose is the
+        # predicted mean; only the uncertainty grows
+        self.fusion.set_prior(
+            np.array([[sim_state['x_pos'], sim_state['y_pos'], sim_state['height']]]),
+            np.array([sim_state['yaw_angle']])
+        )
+        self.fusion.predict(dt, propagate_mean=False)
+        self.fusion.update(*measurement_arrays([measurement]))
+
+        # Write the fused estimate back so the twin matches the physical drone
+        drone_id = self.command_queue.default_drone
+        estimate = self.fusion.get_estimate(drone_id)
+        with self.sim_lock:
+            self.simulator.x_pos = estimate['x']
+            self.simulator.y_pos = estimate['y']
+            self.simulator.height = max(0.0, estimate['z'])
+            self.simulator.yaw_angle = estimate['yaw']
+
+        self.sync_metrics = self.fusion.get_metrics(drone_id)
+        if self.sync_metrics['diverged']:
+            self.divergences += 1
+        self.sync_metrics['divergences'] = self.divergences   # diverged samples so far
+        return self.sync_metrics
@@ -4,7 +4,9 @@ from enum import Enum
 from typing import Dict, Optional, Tuple
 import sys
 sys.path.append('..')
-from config.tello_specs import FLIGHT, VISION
+from config.tello_specs import FLIGHT, VISION, COMMAND_LIMITS
+from mock_data.trajectory import ArcTrajectory, body_to_twin
+from utils.tracing import traced
 
 class TelloCommands(Enum):
     """
@@ -25,6 +27,10 @@ class TelloCommands(Enum):
     FORWARD = "forward"          # Move forward x cm
     BACK = "back"                # Move backward x cm
     
+    # Trajectory Commands
+    GO = "go"                    # Fly to x y z at speed
+    CURVE = "curve"              # Fly an arc through x1 y1 z1 to x2 y2 z2 at speed
+    
     # Rotational Commands
     CW = "cw"                    # Rotate clockwise x degrees
     CCW = "ccw"                  # Rotate counter-clockwise x degrees
@@ -32,6 +38,9 @@ class TelloCommands(Enum):
     # Speed Command
     SPEED = "speed"              # Set speed x cm/s
     
+    # Remote Control Command
+    RC = "rc"                    # Set rc stick values a b c d
+    
     # Read Commands
     BATTERY = "battery?"         # Get battery percentage
     SPEED_READ = "speed?"        # Get current speed
@@ -48,19 +57,36 @@ class CommandHandler:
         self.state = state_controller
         self.command_limits = {
             'movement': {
-                'min': 20,    # minimum 20cm movement
-                'max': 500    # maximum 500cm movement
+                'min': COMMAND_LIMITS['MOVEMENT']['MIN'],    # minimum 20cm movement
+                'max': COMMAND_LIMITS['MOVEMENT']['MAX']     # maximum 500cm movement
             },
             'rotation': {
-                'min': 1,     # minimum 1 degree rotation
-                'max': 360    # maximum 360 degree rotation
+                'min': COMMAND_LIMITS['ROTATION']['MIN'],    # minimum 1 degree rotation
+                'max': COMMAND_LIMITS['ROTATION']['MAX']     # maximum 360 degree rotation
             },
             'speed': {
-                'min': 10,    # minimum 10cm/s
-                'max': 100    # maximum 100cm/s
+                'min': COMMAND_LIMITS['SPEED']['MIN'],       # minimum 10cm/s
+                'max': COMMAND_LIMITS['SPEED']['MAX']        # maximum 100cm/s
+            },
+            'rc': {
+                'min': COMMAND_LIMITS['RC']['MIN'],          # full left/back/down/ccw
+                'max': COMMAND_LIMITS['RC']['MAX']           # full right/forward/up/cw
+            },
+            'coordinate': {
+                'min': COMMAND_LIMITS['COORDINATE']['MIN'],  # -500cm go/curve offset
+                'max': COMMAND_LIMITS['COORDINATE']['MAX']   # 500cm go/curve offset
+            },
+            'curve_speed': {
+                'min': COMMAND_LIMITS['CURVE_SPEED']['MIN'], # minimum 10cm/s
+                'max': COMMAND_LIMITS['CURVE_SPEED']['MAX']  # maximum 60cm/s
+            },
+            'curve_radius': {
+                'min': COMMAND_LIMITS['CURVE_RADIUS']['MIN'],  # minimum 0.5m arc radius
+                'max': COMMAND_LIMITS['CURVE_RADIUS']['MAX']   # maximum 10m arc radius
             }
         }
 
+    @traced('command_handler.execute')
     def execute_command(self, command: str, params: Optional[str] = None) -> Tuple[bool, str]:
         """
         Execute a Tello command with parameters
@@ -107,6 +133,33 @@ class CommandHandler:
                 success = self.state.move(cmd.value, distance)
                 return success, f"Moved {cmd.value} {distance}cm"
                 
+            # Trajectory Commands
+            elif cmd == TelloCommands.GO:
+                if not params or len(params.split()) != 4:
+                    return False, "x y z speed parameters required"
+                x, y, z, speed = [int(value) for value in params.split()]
+                if not self._validate_point(x, y, z):
+                    return False, f"Invalid target: {x} {y} {z}cm"
+                if not self._validate_speed(speed):
+                    return False, f"Invalid speed: {speed}cm/s"
+                
+                success = self.state.go(x, y, z, speed)
+                return success, f"Flew to {x} {y} {z}cm"
+                
+            elif cmd == TelloCommands.CURVE:
+                if not params or len(params.split()) != 7:
+                    return False, "x1 y1 z1 x2 y2 z2 speed parameters required"
+                x1, y1, z1, x2, y2, z2, speed = [int(value) for value in params.split()]
+                if not (self._validate_point(x1, y1, z1) and self._validate_point(x2, y2, z2)):
+                    return False, f"Invalid curve points: {params}"
+                if not self._validate_curve_speed(speed):
+                    return False, f"Invalid curve speed: {speed}cm/s"
+                if not self._validate_curve_radius(x1, y1, z1, x2, y2, z2):
+                    return False, f"Invalid curve radius: {params}"
+                
+                success = self.state.curve(x1, y1, z1, x2, y2, z2, speed)
+                return success, f"Curved to {x2} {y2} {z2}cm"
+                
             # Rotation Commands
             elif cmd in [TelloCommands.CW, TelloCommands.CCW]:
                 if not params:
@@ -129,6 +182,17 @@ class CommandHandler:
                 success = self.state.set_speed(speed)
                 return success, f"Speed set to {speed}cm/s"
                 
+            # Remote Control Command
+            elif cmd == TelloCommands.RC:
+                if not params or len(params.split()) != 4:
+                    return False, "Four rc parameters required"
+                sticks = [int(value) for value in params.split()]
+                if not all(self._validate_rc(value) for value in sticks):
+                    return False, f"Invalid rc values: {params}"
+                
+                success = self.state.set_rc(*sticks)
+                return success, f"RC set to {params}"
+                
             # Read Commands
             elif cmd == TelloCommands.BATTERY:
                 return True, str(self.state.battery)
@@ -156,4 +220,26 @@ class CommandHandler:
     
     def _validate_speed(self, speed: int) -> bool:
         """Validate speed value"""
-        return self.command_limits['speed']['min'] <= speed <= self.command_limits['speed']['max']
\ No newline at end of file
+        return self.command_limits['speed']['min'] <= speed <= self.command_limits['speed']['max']
+    
+    def _validate_rc(self, value: int) -> bool:
+        """Validate rc stick value"""
+        return self.command_limits['rc']['min'] <= value <= self.command_limits['rc']['max']
+    
+    def _validate_point(self, x: int, y: int, z: int) -> bool:
+        """Validate go/curve offset: in range and not all within the minimum movement"""
+        limits = self.command_limits['coordinate']
+        if not all(limits['min'] <= value <= limits['max'] for value in (x, y, z)):
+            return False
+        minimum = self.command_limits['movement']['min']
+        return not all(-minimum <= value <= minimum for value in (x, y, z))
+    
+    def _validate_curve_speed(self, speed: int) -> bool:
+        """Validate curve speed value"""
+        return self.command_limits['curve_speed']['min'] <= speed <= self.command_limits['curve_speed']['max']
+    
+    def _validate_curve_radius(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int) -> bool:
+        """Validate the radius of the arc through both curve points"""
+        arc = ArcTrajectory([0, 0, 0], body_to_twin(x1, y1, z1), body_to_twin(x2, y2, z2), [1.0])
+        radius = arc.radius[0]
+        return self.command_limits['curve_radius']['min'] <= radius <= self.command_limits['curve_radius']['max']
\ No newline at end of file
@@ -0,0 +1,165 @@
+# communication/fusion.py
+
+import math
+import numpy as np
+from typing import Dict, List, Optional
+
+# State vector layout: x, y, z (m), vx, vy, vz (m/s), yaw (degrees)
+STATE_FIELDS = ('x', 'y', 'z', 'vx', 'vy', 'vz', 'yaw')
+STATE_SIZE = len(STATE_FIELDS)
+YAW = 6
+
+# Process noise spectral density per state (units^2 / s)
+PROCESS_NOISE = np.array([0.05, 0.05, 0.05, 0.5, 0.5, 0.5, 4.0])
+
+# Measurement noise variance per state
+MEASUREMENT_NOISE = np.array([0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 1.0])
+
+# Variance used for channels missing from a sample
+UNOBSERVED_NOISE = 1e9
+
+# Position residual (m) above which the twin is flagged as diverged
+DIVERGENCE_THRESHOLD = 0.5
+
+
+def parse_tello_state(state_string: str) -> Dict[str, float]:
+    """
+    Parse a Tello state string ("pitch:0;roll:0;yaw:12;...;") into
+    measurements in twin units (meters, m/s, degrees).
+    Position is only present when mission pads are detected.
+    """
+    raw = {}
+    for item in state_string.strip().split(';'):
+        if ':' not in item:
+            continue
+        key, value = item.split(':', 1)
+        try:
+            raw[key.strip()] = float(value)
+        except ValueError:
+            continue
+
+    measurement = {}
+    if raw.get('mid', -1) > 0:
+        measurement['x'] = raw['x'] / 100   # cm -> m
+        measurement['y'] = raw['y'] / 100
+    if 'h' in raw:
+        measurement['z'] = raw['h'] / 100
+    for axis in ('x', 'y', 'z'):
+        key = f'vg{axis}'
+        if key in raw:
+            measurement[f'v{axis}'] = raw[key] / 10   # dm/s -> m/s
+    if 'yaw' in raw:
+        measurement['yaw'] = raw['yaw'] % 360
+    return measurement
+
+
+class FleetKalmanFilter:
+    """
+    Constant-velocity Kalman filter run for every drone at once.
+    Means are stored as (N, 7) and covariances as (N, 7, 7) arrays so a
+    predict/update cycle costs a handful of batched numpy operations
+    regardless of fleet size.
+    """
+    def __init__(self, drone_ids: List[str],
+                 divergence_threshold: float = DIVERGENCE_THRESHOLD):
+        self.drone_ids = list(drone_ids)
+        self.index = {drone_id: i for i, drone_id in enumerate(self.drone_ids)}
+        n = len(self.drone_ids)
+
+        self.x = np.zeros((n, STATE_SIZE))
+        self.P = np.tile(np.eye(STATE_SIZE), (n, 1, 1))
+        self.divergence_threshold = divergence_threshold
+
+        # Latest metrics per drone
+        self.residual = np.zeros((n, STATE_SIZE))
+        self.nis = np.zeros(n)                  # normalized innovation squared
+        self.position_error = np.zeros(n)       # meters
+        self.diverged = np.zeros(n, dtype=bool)
+
+    def set_prior(self, positions: np.ndarray, yaw: np.ndarray,
+                  mask: Optional[np.ndarray] = None):
+        """
+        Use the twin's dead-reckoned pose as the prior mean.
+        positions: (N, 3) meters, yaw: (N,) degrees
+        """
+        if mask is None:
+            mask = slice(None)
+        self.x[mask, 0:3] = positions
+        self.x[mask, YAW] = yaw
+
+    def predict(self, dt, propagate_mean: bool = True):
+        """
+        Propagate all drones forward by dt seconds (scalar or (N,)).
+        With propagate_mean=False only the covariance grows, for when the
+        mean was just set from a twin that has already moved.
+        """
+        dt = np.broadcast_to(np.asarray(dt, dtype=float), (len(self.drone_ids),))
+        F = np.tile(np.eye(STATE_SIZE), (len(self.drone_ids), 1, 1))
+        F[:, 0, 3] = dt
+        F[:, 1, 4] = dt
+        F[:, 2, 5] = dt
+
+        if propagate_mean:
+            self.x = np.einsum('nij,nj->ni', F, self.x)
+            self.x[:, YAW] %= 360
+        Q = PROCESS_NOISE[None, :] * dt[:, None]
+        self.P = F @ self.P @ F.transpose(0, 2, 1)
+        self.P[:, np.arange(STATE_SIZE), np.arange(STATE_SIZE)] += Q
+
+    def update(self, z: np.ndarray, observed: np.ndarray):
+        """
+        Fold one sample per drone into the estimate.
+        z: (N, 7) measurements, observed: (N, 7) boolean mask of valid channels.
+        Drones with no observed channels are left untouched.
+        """
+        innovation = np.where(observed, z - self.x, 0.0)
+        innovation[:, YAW] = (innovation[:, YAW] + 180) % 360 - 180
+
+        R = np.where(observed, MEASUREMENT_NOISE[None, :], UNOBSERVED_NOISE)
+        S = self.P.copy()
+        S[:, np.arange(STATE_SIZE), np.arange(STATE_SIZE)] += R
+
+        # K = P S^-1, solved as S^T K^T = P^T
+        K = np.linalg.solve(S.transpose(0, 2, 1), self.P.transpose(0, 2, 1)).transpose(0, 2, 1)
+
+        self.x = self.x + np.einsum('nij,nj->ni', K, innovation)
+        self.x[:, YAW] %= 360
+        I = np.eye(STATE_SIZE)[None, :, :]
+        self.P = (I - K) @ self.P
+
+        active = observed.any(axis=1)
+        self.residual = np.where(active[:, None], innovation, self.residual)
+        nis = np.einsum('ni,ni->n', innovation, np.linalg.solve(S, innovation[:, :, None])[:, :, 0])
+        self.nis = np.where(active, nis, self.nis)
+        position_error = np.linalg.norm(innovation[:, 0:3], axis=1)
+        self.position_error = np.where(active, position_error, self.position_error)
+        self.diverged = self.position_error > self.divergence_threshold
+
+    def get_metrics(self, drone_id: str) -> Dict:
+        """Get residual and divergence metrics for one drone"""
+        i = self.index[drone_id]
+        return {
+            'residual': dict(zip(STATE_FIELDS, np.round(self.residual[i], 4).tolist())),
+            'nis': float(self.nis[i]),
+            'position_error': float(self.position_error[i]),
+            'diverged': bool(self.diverged[i])
+        }
+
+    def get_estimate(self, drone_id: str) -> Dict[str, float]:
+        """Get the fused state of one drone"""
+        i = self.index[drone_id]
+        return dict(zip(STATE_FIELDS, self.x[i].tolist()))
+
+
+def measurement_arrays(samples: List[Optional[Dict[str, float]]]):
+    """Stack per-drone measurement dicts into (N, 7) value and mask arrays"""
+    z = np.zeros((len(samples), STATE_SIZE))
+    observed = np.zeros((len(samples), STATE_SIZE), dtype=bool)
+    for i, sample in enumerate(samples):
+        if not sample:
+            continue
+        for j, field in enumerate(STATE_FIELDS):
+            if field in sample and not math.isnan(sample[field]):
+                z[i, j] = sample[field]
+                observed[i, j] = True
+    return z, observed
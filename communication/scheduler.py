@@ -0,0 +1,183 @@
+# communication/scheduler.py
+
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+import sys
+sys.path.append('..')
+from config.tello_specs import COMMAND_LIMITS
+
+# Commands that jump ahead of everything queued for a drone
+PRIORITY_COMMANDS = ('emergency', 'land', 'stop')
+
+# Priority commands after which queued moves would be rejected anyway
+FLUSHING_COMMANDS = ('emergency', 'land')
+
+# Commands where a newer value replaces a queued one
+LATEST_WINS_COMMANDS = ('speed',)
+
+# Commands whose arguments can be summed, with the limit that applies
+MERGEABLE_COMMANDS = {
+    'up': 'MOVEMENT',
+    'down': 'MOVEMENT',
+    'left': 'MOVEMENT',
+    'right': 'MOVEMENT',
+    'forward': 'MOVEMENT',
+    'back': 'MOVEMENT',
+    'cw': 'ROTATION',
+    'ccw': 'ROTATION'
+}
+
+
+class CommandScheduler:
+    """
+    Per-drone command scheduler.
+
+    A drone only receives its next command once the previous one has
+    completed. While it is busy, consecutive compatible commands are merged
+    (forward 100 + forward 150 -> forward 250) as long as both parts and the
+    result stay within the Tello limits, and emergency/land/stop skip the
+    queue. A drone stays busy until every command sent to it is done.
+    """
+    def __init__(self, default_drone: str = 'tello'):
+        self.default_drone = default_drone
+        self.pending: Dict[str, deque] = {}
+        self.priority: Dict[str, deque] = {}
+        self.in_flight: Dict[str, int] = {}     # commands sent but not yet done
+        self.stats = {
+            'queued': 0,
+            'merged': 0,
+            'dropped': 0,
+            'dispatched': 0
+        }
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+
+    def put(self, command: str, drone_id: Optional[str] = None):
+        """Queue a command for a drone"""
+        drone_id = drone_id or self.default_drone
+        command = ' '.join(command.strip().split())
+        verb = command.split(' ')[0]
+        entry = [command, time.perf_counter()]
+
+        with self._lock:
+            pending = self.pending.setdefault(drone_id, deque())
+            self.stats['queued'] += 1
+
+            if verb in PRIORITY_COMMANDS:
+                if verb in FLUSHING_COMMANDS:
+                    self.stats['dropped'] += len(pending)
+                    pending.clear()
+                self.priority.setdefault(drone_id, deque()).append(entry)
+            elif pending and self._merge(pending, command):
+                self.stats['merged'] += 1
+            else:
+                pending.append(entry)
+
+            self._ready.notify_all()
+
+    def _merge(self, pending: deque, command: str) -> bool:
+        """Try to fold a command into the last queued one, keeping its queue time"""
+        merged = merge_commands(pending[-1][0], command)
+        if merged is None:
+            return False
+        pending[-1][0] = merged
+        return True
+
+    def get_next(self, drone_id: Optional[str] = None) -> Optional[str]:
+        """
+        Pop the next command a drone can execute now.
+        Priority commands are returned even while the drone is busy.
+        """
+        drone_id = drone_id or self.default_drone
+        with self._lock:
+            popped = self._pop(drone_id)
+        return popped[0] if popped else None
+
+    def _pop(self, drone_id: str,
+             priority: Optional[bool] = None) -> Optional[Tuple[str, float, float]]:
+        lane = self.priority.get(drone_id)
+        if lane and priority is not False:
+            command, enqueued_at = lane.popleft()
+        elif priority or self.in_flight.get(drone_id):
+            return None
+        elif self.pending.get(drone_id):
+            command, enqueued_at = self.pending[drone_id].popleft()
+        else:
+            return None
+
+        self.in_flight[drone_id] = self.in_flight.get(drone_id, 0) + 1
+        self.stats['dispatched'] += 1
+        return command, enqueued_at, time.perf_counter()
+
+    def get_ready(self, timeout: Optional[float] = None,
+                  priority: Optional[bool] = None) -> List[Tuple[str, str, float, float]]:
+        """
+        Pop one executable command for every drone that has one.
+        priority=True only takes the priority lane, False only the regular one.
+        Blocks up to timeout seconds when nothing is ready.
+        Returns: [(drone_id, command, enqueued_at, dequeued_at), ...]
+        """
+        with self._lock:
+            ready = self._collect_ready(priority)
+            if not ready and timeout:
+                self._ready.wait(timeout)
+                ready = self._collect_ready(priority)
+            return ready
+
+    def _collect_ready(self, priority: Optional[bool]) -> List[Tuple[str, str, float, float]]:
+        ready = []
+        for drone_id in set(self.pending) | set(self.priority):
+            popped = self._pop(drone_id, priority)
+            if popped is not None:
+                ready.append((drone_id,) + popped)
+        return ready
+
+    def mark_done(self, drone_id: Optional[str] = None):
+        """Mark one of a drone's commands as completed"""
+        drone_id = drone_id or self.default_drone
+        with self._lock:
+            self.in_flight[drone_id] = max(0, self.in_flight.get(drone_id, 0) - 1)
+            self._ready.notify_all()
+
+    def is_busy(self, drone_id: Optional[str] = None) -> bool:
+        """Check whether a drone is still executing a command"""
+        return self.in_flight.get(drone_id or self.default_drone, 0) > 0
+
+    def empty(self, drone_id: Optional[str] = None) -> bool:
+        """Check whether any commands are waiting"""
+        with self._lock:
+            if drone_id is not None:
+                return not (self.pending.get(drone_id) or self.priority.get(drone_id))
+            return not any(self.pending.values()) and not any(self.priority.values())
+
+
+def merge_commands(first: str, second: str) -> Optional[str]:
+    """
+    Merge two commands into one if they are compatible.
+    Returns the merged command or None.
+    """
+    first_parts = first.split(' ')
+    second_parts = second.split(' ')
+    verb = first_parts[0]
+
+    if verb in LATEST_WINS_COMMANDS and second_parts[0] == verb:
+        return second  # only the newest value matters
+
+    if verb != second_parts[0] or verb not in MERGEABLE_COMMANDS:
+        return None
+    if len(first_parts) != 2 or len(second_parts) != 2:
+        return None
+
+    try:
+        values = [int(first_parts[1]), int(second_parts[1])]
+    except ValueError:
+        return None
+
+    # Each part must be valid on its own, or two rejected moves become one accepted move
+    limits = COMMAND_LIMITS[MERGEABLE_COMMANDS[verb]]
+    total = sum(values)
+    if not all(limits['MIN'] <= value <= limits['MAX'] for value in values + [total]):
+        return None
+    return f"{verb} {total}"
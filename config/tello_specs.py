@@ -24,5 +24,38 @@ BATTERY = {
     'VOLTAGE': 3.8,        # V
     'CAPACITY': 1100,      # mAh
     'TYPE': 'LiPo',
-    'ENERGY': 4.18         # Wh
+    'ENERGY': 4.18,        # Wh
+    'FLIGHT_TIME': 13      # minutes
+}
+
+
+COMMAND_LIMITS = {
+    'MOVEMENT': {
+        'MIN': 20,         # cm
+        'MAX': 500         # cm
+    },
+    'ROTATION': {
+        'MIN': 1,          # degrees
+        'MAX': 360         # degrees
+    },
+    'SPEED': {
+        'MIN': 10,         # cm/s
+        'MAX': 100         # cm/s
+    },
+    'RC': {
+        'MIN': -100,       # stick deflection
+        'MAX': 100         # stick deflection
+    },
+    'COORDINATE': {
+        'MIN': -500,       # cm, go/curve offsets
+        'MAX': 500         # cm
+    },
+    'CURVE_SPEED': {
+        'MIN': 10,         # cm/s
+        'MAX': 60          # cm/s
+    },
+    'CURVE_RADIUS': {
+        'MIN': 0.5,        # meters
+        'MAX': 10.0        # meters
+    }
 }
@@ -0,0 +1,167 @@
+# mock_data/checkpoint.py
+
+import copyreg
+import io
+import pickle
+import random
+import zlib
+from typing import Dict, Optional
+import sys
+sys.path.append('..')
+from mock_data.wind import WindField
+from mock_data.obstacles import VoxelMap
+from mock_data.simulation import FleetSimulation
+
+MAGIC = b'TELLOCKP'
+VERSION = 1
+
+# Large read-only environment objects that forks can share instead of copy
+ENVIRONMENT_TYPES = (WindField, VoxelMap)
+
+# Globals a checkpoint may load besides classes from the packages below
+SAFE_GLOBALS = {
+    ('collections', 'deque'),
+    ('random', 'Random'),
+    ('numpy', 'dtype'),
+    ('numpy', 'ndarray'),
+    ('numpy.core.numeric', '_frombuffer'),
+    ('numpy.core.multiarray', '_reconstruct'),
+    ('numpy.core.multiarray', 'scalar'),
+    ('mock_data.checkpoint', '_new_instance')
+}
+SAFE_PACKAGES = ('mock_data.', 'communication.', 'config.', 'utils.')
+
+# Methods a checkpoint may look up: the callbacks FleetSimulation schedules
+SCHEDULED_CALLBACKS = ('_complete', '_emit_telemetry', '_battery_low', 'publish_to')
+
+
+def _current_class(cls: type) -> type:
+    """The class now bound to cls's qualified name, e.g. after a module reload"""
+    module = sys.modules.get(cls.__module__)
+    current = getattr(module, cls.__qualname__, None)
+    return current if isinstance(current, type) else cls
+
+
+def _new_instance(cls: type):
+    return cls.__new__(cls)
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Pickler that stores environment objects by reference. Objects are
+    pickled by their class's qualified name, so instances created before
+    a module reload load as the reloaded class.
+    """
+    def __init__(self, file, environment: Optional[Dict[int, object]] = None):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.environment = environment
+        self.classes = {}
+
+    def persistent_id(self, obj):
+        if self.environment is not None and isinstance(obj, ENVIRONMENT_TYPES):
+            self.environment[id(obj)] = obj
+            return ('environment', id(obj))
+        return None
+
+    def reducer_override(self, obj):
+        cls = type(obj)
+        if cls not in self.classes:
+            self.classes[cls] = _current_class(cls)
+        current = self.classes[cls]
+        if current is cls:
+            return NotImplemented
+        reduced = obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+        if reduced[0] is not copyreg.__newobj__ or len(reduced[1]) > 1:
+            return NotImplemented
+        return (_new_instance, (current,)) + reduced[2:]
+
+
+class _Unpickler(pickle.Unpickler):
+    """
+    Unpickler resolving environment references. Only simulator classes and
+    a few container/numpy globals can be loaded, and getattr is limited to
+    the event callbacks a FleetSimulation schedules.
+    """
+    def __init__(self, file, environment: Dict[int, object]):
+        super().__init__(file)
+        self.environment = environment
+
+    def find_class(self, module, name):
+        if (module, name) == ('builtins', 'getattr'):
+            return _method_of
+        if (module, name) in SAFE_GLOBALS:
+            return super().find_class(module, name)
+        if module.startswith(SAFE_PACKAGES) and '.' not in name:
+            obj = super().find_class(module, name)
+            if isinstance(obj, type):
+                return obj
+        raise pickle.UnpicklingError(f"Checkpoint may not load {module}.{name}")
+
+    def persistent_load(self, pid):
+        kind, key = pid
+        if kind != 'environment' or key not in self.environment:
+            raise pickle.UnpicklingError(f"Missing environment object {pid}")
+        return self.environment[key]
+
+
+def _method_of(obj, name: str):
+    """getattr restricted to the scheduled callbacks of a FleetSimulation"""
+    if name not in SCHEDULED_CALLBACKS or not isinstance(obj, _current_class(FleetSimulation)):
+        raise pickle.UnpicklingError(f"Checkpoint may not look up {type(obj).__name__}.{name}")
+    return getattr(obj, name)
+
+
+def save_checkpoint(simulation, path: Optional[str] = None,
+                    environment: Optional[Dict[int, object]] = None) -> bytes:
+    """
+    Serialize full simulator state: drones, clocks, RNG state, event and
+    command queues, logs and histories.
+    With an environment dict, wind fields and obstacle maps are stored by
+    reference into it instead of being copied. Writes to path if given.
+    """
+    buffer = io.BytesIO()
+    buffer.write(MAGIC)
+    buffer.write(bytes([VERSION]))
+    _Pickler(buffer, environment).dump(simulation)
+    data = buffer.getvalue()
+
+    if path:
+        with open(path, 'wb') as f:
+            f.write(data)
+    return data
+
+
+def load_checkpoint(data, environment: Optional[Dict[int, object]] = None):
+    """
+    Restore a simulation from checkpoint bytes or a file path.
+    Checkpoints are pickles. Loading is limited to simulator classes and
+    scheduled callbacks, which narrows but does not remove what a crafted
+    file can do, so only open checkpoints from sources you trust.
+    """
+    if isinstance(data, str):
+        with open(data, 'rb') as f:
+            data = f.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a Tello checkpoint")
+    if data[len(MAGIC)] != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {data[len(MAGIC)]}")
+
+    buffer = io.BytesIO(data)
+    buffer.seek(len(MAGIC) + 1)
+    return _Unpickler(buffer, environment or {}).load()
+
+
+def fork(simulation, seed: Optional[int] = None):
+    """
+    Copy a simulation so a scenario can branch from its current state.
+    Wind fields and obstacle maps are shared, not copied. With a seed,
+    every drone's RNG is reseeded so forks diverge deterministically.
+    """
+    environment = {}
+    data = save_checkpoint(simulation, environment=environment)
+    forked = load_checkpoint(data, environment)
+
+    if seed is not None:
+        for drone_id, state in getattr(forked, 'drones', {}).items():
+            state.rng = random.Random(zlib.crc32(f"{seed}:{drone_id}".encode()))
+    return forked
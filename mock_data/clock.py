@@ -0,0 +1,29 @@
+# mock_data/clock.py
+
+import time
+
+class WallClock:
+    """Clock backed by real time"""
+    def time(self) -> float:
+        return time.time()
+
+class VirtualClock:
+    """
+    Clock that only moves when told to.
+    Lets simulations jump straight to the next event instead of waiting.
+    """
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, dt: float):
+        """Move the clock forward by dt seconds"""
+        if dt < 0:
+            raise ValueError(f"Cannot move clock backwards by {dt}s")
+        self.now += dt
+
+    def advance_to(self, timestamp: float):
+        """Move the clock forward to an absolute time"""
+        self.advance(timestamp - self.now)
@@ -0,0 +1,285 @@
+# mock_data/fleet.py
+
+import multiprocessing
+import numpy as np
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+from typing import Dict, List, Tuple
+import sys
+sys.path.append('..')
+from config.tello_specs import FLIGHT, VISION
+from mock_data.states import BATTERY_DRAIN, RC_YAW_RATE
+from mock_data.shared_state import attach_shared_memory
+
+# Columns of the fleet state array, in order
+FLEET_FIELDS = (
+    'x_pos', 'y_pos', 'height', 'vx', 'vy', 'vz', 'yaw_angle', 'yaw_rate',
+    'battery', 'is_flying', 'collided', 'nearest'
+)
+X, Y, Z, VX, VY, VZ, YAW, YAW_RATE, BATTERY, FLYING, COLLIDED, NEAREST = range(len(FLEET_FIELDS))
+
+# Drones closer than this are reported by the proximity check (meters)
+PROXIMITY_RADIUS = 1.0
+
+# Fleet tick length (seconds)
+TICK = 0.1
+
+# Cell coordinates are packed into one int64 key, CELL_BITS per axis
+CELL_BITS = 21
+CELL_OFFSET = 1 << (CELL_BITS - 1)
+NO_CELL = -1    # key of landed drones, never matches a query
+
+# Horizontal neighbour cells; the three vertical neighbours of a cell are adjacent keys
+NEIGHBOUR_SHIFTS = [(dx << (2 * CELL_BITS)) + (dy << CELL_BITS)
+                    for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+# Control block: command, ticks to run, first tick
+CONTROL_RUN, CONTROL_STOP = 1, 2
+
+
+def shard_bounds(count: int, shards: int) -> List[Tuple[int, int]]:
+    """Split count rows into contiguous, nearly equal shards"""
+    edges = np.linspace(0, count, shards + 1).round().astype(int)
+    return [(int(lo), int(hi)) for lo, hi in zip(edges[:-1], edges[1:])]
+
+
+def _cell_keys(positions: np.ndarray, flying: np.ndarray, radius: float) -> np.ndarray:
+    cells = np.floor(positions / radius).astype(np.int64) + CELL_OFFSET
+    keys = (cells[:, 0] << (2 * CELL_BITS)) | (cells[:, 1] << CELL_BITS) | cells[:, 2]
+    return np.where(flying, keys, NO_CELL)
+
+
+def step_drones(state: np.ndarray, lo: int, hi: int, t: float, dt: float,
+                wind=None, obstacles=None):
+    """
+    Advance rows [lo, hi) of the fleet by one tick. Every operation is
+    per row, so any split of the fleet gives bit-identical results.
+    """
+    rows = state[lo:hi]
+    flying = rows[:, FLYING] > 0
+    start = rows[:, X:Z + 1]
+    velocity = rows[:, VX:VZ + 1]
+    target = start + velocity * dt
+
+    # Wind only drifts manoeuvring drones, position hold rejects it in a hover
+    moving = flying & (velocity != 0).any(axis=1)
+    if wind is not None and moving.any():
+        target[moving] += wind.displacement(start[moving], t, dt)
+    target[:, 2] = np.clip(target[:, 2], VISION['HEIGHT_RANGE']['MIN'], VISION['HEIGHT_RANGE']['MAX'])
+
+    collided = np.zeros(len(rows), dtype=bool)
+    if obstacles is not None and moving.any():
+        hit, stop = obstacles.sweep(start[moving], target[moving])
+        target[moving] = stop
+        collided[moving] = hit
+    rows[:, X:Z + 1] = np.where(moving[:, None], target, start)
+    rows[moving, COLLIDED] = collided[moving]    # kept until the drone moves again
+    rows[collided, VX:VZ + 1] = 0.0
+
+    rows[:, YAW] = np.where(flying, (rows[:, YAW] + rows[:, YAW_RATE] * dt) % 360, rows[:, YAW])
+    rows[:, BATTERY] = np.where(flying, np.maximum(rows[:, BATTERY] - dt * BATTERY_DRAIN, 0.0),
+                                rows[:, BATTERY])
+
+    # Flat batteries land where they are
+    empty = flying & (rows[:, BATTERY] <= 0)
+    rows[empty, FLYING] = 0.0
+    rows[empty, Z] = 0.0
+    rows[empty, VX:VZ + 1] = 0.0
+    rows[empty, YAW_RATE] = 0.0
+
+
+def index_shard(state: np.ndarray, keys: np.ndarray, order: np.ndarray,
+                lo: int, hi: int, radius: float = PROXIMITY_RADIUS):
+    """Sort a shard's drones by grid cell into keys/order[lo:hi]"""
+    shard_keys = _cell_keys(state[lo:hi, X:Z + 1], state[lo:hi, FLYING] > 0, radius)
+    local = np.argsort(shard_keys, kind='stable')
+    keys[lo:hi] = shard_keys[local]
+    order[lo:hi] = lo + local
+
+
+def nearest_neighbours(state: np.ndarray, keys: np.ndarray, order: np.ndarray,
+                       shards: List[Tuple[int, int]], lo: int, hi: int,
+                       radius: float = PROXIMITY_RADIUS):
+    """
+    Distance from each drone in rows [lo, hi) to its nearest flying
+    neighbour anywhere in the fleet, inf beyond radius. Searches the 27
+    surrounding cells in every shard's sorted cell index, querying with
+    the shard's own sorted keys so lookups walk memory in order.
+    """
+    positions = state[:, X:Z + 1]
+    nearest = np.full(hi - lo, np.inf)
+    first = int(np.searchsorted(keys[lo:hi], 0))   # landed drones sort first
+    query = keys[lo + first:hi]
+    rows = order[lo + first:hi]
+
+    for shift in NEIGHBOUR_SHIFTS:
+        base = query + shift
+        for s_lo, s_hi in shards:
+            shard_keys = keys[s_lo:s_hi]
+            left = np.searchsorted(shard_keys, base - 1, side='left')
+            counts = np.searchsorted(shard_keys, base + 1, side='right') - left
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            # Expand every (drone, candidate) pair in the matching cells
+            drone = np.repeat(rows, counts)
+            within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            candidate = order[s_lo + np.repeat(left, counts) + within]
+            keep = candidate != drone
+            drone, candidate = drone[keep], candidate[keep]
+            distance = np.sqrt(((positions[candidate] - positions[drone]) ** 2).sum(axis=1))
+            np.minimum.at(nearest, drone - lo, distance)
+
+    nearest[nearest > radius] = np.inf
+    state[lo:hi, NEAREST] = nearest
+
+
+def _views(buf, count: int):
+    state = np.ndarray((count, len(FLEET_FIELDS)), dtype=np.float64, buffer=buf)
+    offset = state.nbytes
+    keys = np.ndarray((count,), dtype=np.int64, buffer=buf, offset=offset)
+    order = np.ndarray((count,), dtype=np.int64, buffer=buf, offset=offset + keys.nbytes)
+    control = np.ndarray((3,), dtype=np.int64, buffer=buf, offset=offset + 2 * keys.nbytes)
+    return state, keys, order, control
+
+
+def _worker(name: str, count: int, shard: int, shards, dt: float, start_time: float,
+            radius: float, wind, obstacles, control_barrier, tick_barrier):
+    shm = attach_shared_memory(name)
+    state, keys, order, control = _views(shm.buf, count)
+    lo, hi = shards[shard]
+    try:
+        while True:
+            control_barrier.wait()
+            if control[0] == CONTROL_STOP:
+                break
+            ticks, first = int(control[1]), int(control[2])
+            for tick in range(first, first + ticks):
+                step_drones(state, lo, hi, start_time + tick * dt, dt, wind, obstacles)
+                index_shard(state, keys, order, lo, hi, radius)
+                tick_barrier.wait()     # every shard moved and indexed
+                nearest_neighbours(state, keys, order, shards, lo, hi, radius)
+                tick_barrier.wait()     # nobody moves while others still read
+            control_barrier.wait()
+    except BrokenBarrierError:
+        pass
+    except Exception:
+        control_barrier.abort()
+        tick_barrier.abort()
+        raise
+    finally:
+        del state, keys, order, control
+        shm.close()
+
+
+class ShardedFleet:
+    """
+    Fleet state held in shared-memory arrays and stepped in fixed ticks.
+    With workers > 0 the rows are split into contiguous shards, each
+    stepped by its own process; ticks are barrier-synchronized so the
+    proximity check runs on a complete, stable frame. The step and the
+    nearest-neighbour search are per drone, so results do not depend on
+    the number of workers.
+    """
+    def __init__(self, count: int, workers: int = 0, dt: float = TICK,
+                 wind=None, obstacles=None, radius: float = PROXIMITY_RADIUS,
+                 start_time: float = 0.0):
+        self.count = count
+        self.workers = workers
+        self.dt = dt
+        self.wind = wind
+        self.obstacles = obstacles
+        self.radius = radius
+        self.start_time = start_time
+        self.tick = 0
+        self.shards = shard_bounds(count, max(workers, 1))
+
+        size = count * (len(FLEET_FIELDS) + 2) * 8 + 3 * 8
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        self.state, self.keys, self.order, self.control = _views(self.shm.buf, count)
+        self.state[:] = 0.0
+        self.state[:, BATTERY] = 100.0
+        self.state[:, NEAREST] = np.inf
+        self.processes = []
+
+    @property
+    def time(self) -> float:
+        return self.start_time + self.tick * self.dt
+
+    def load_drones(self, drones: Dict) -> List[str]:
+        """Copy TelloState objects into the first rows, rc sticks become velocities"""
+        if len(drones) > self.count:
+            raise ValueError(f"Fleet holds {self.count} drones, got {len(drones)}")
+        for i, drone in enumerate(drones.values()):
+            max_speed = (FLIGHT['MAX_SPEED']['SLOW_MODE'] if drone.flight_mode == 'slow'
+                         else FLIGHT['MAX_SPEED']['FAST_MODE']) / 3.6
+            roll, pitch, throttle, yaw = drone.rc
+            self.state[i] = [drone.x_pos, drone.y_pos, drone.height,
+                             roll / 100 * max_speed, pitch / 100 * max_speed,
+                             throttle / 100 * max_speed, drone.yaw_angle,
+                             yaw / 100 * RC_YAW_RATE, drone.battery,
+                             float(drone.is_flying), 0.0, np.inf]
+        return list(drones)
+
+    def start(self):
+        """Start the worker processes"""
+        if self.processes or self.workers == 0:
+            return
+        context = multiprocessing.get_context()
+        self.control_barrier = context.Barrier(self.workers + 1)
+        self.tick_barrier = context.Barrier(self.workers)
+        for shard in range(self.workers):
+            process = context.Process(
+                target=_worker, daemon=True,
+                args=(self.shm.name, self.count, shard, self.shards, self.dt,
+                      self.start_time, self.radius, self.wind, self.obstacles,
+                      self.control_barrier, self.tick_barrier))
+            process.start()
+            self.processes.append(process)
+
+    def run(self, ticks: int):
+        """Advance the fleet by a number of ticks"""
+        if self.workers == 0:
+            lo, hi = self.shards[0]
+            for tick in range(self.tick, self.tick + ticks):
+                step_drones(self.state, lo, hi, self.start_time + tick * self.dt,
+                            self.dt, self.wind, self.obstacles)
+                index_shard(self.state, self.keys, self.order, lo, hi, self.radius)
+                nearest_neighbours(self.state, self.keys, self.order, self.shards,
+                                   lo, hi, self.radius)
+            self.tick += ticks
+            return
+
+        self.start()
+        self.control[:] = [CONTROL_RUN, ticks, self.tick]
+        try:
+            self.control_barrier.wait()     # release the workers
+            self.control_barrier.wait()     # all ticks done
+        except BrokenBarrierError:
+            raise RuntimeError("A fleet worker failed") from None
+        self.tick += ticks
+
+    def proximity_alerts(self) -> np.ndarray:
+        """Rows of drones with a neighbour within the proximity radius"""
+        return np.nonzero(np.isfinite(self.state[:, NEAREST]))[0]
+
+    def snapshot(self) -> np.ndarray:
+        """Copy of the fleet state array"""
+        return self.state.copy()
+
+    def close(self):
+        """Stop the workers and free the shared memory"""
+        if self.processes:
+            self.control[0] = CONTROL_STOP
+            try:
+                self.control_barrier.wait(timeout=10)
+            except BrokenBarrierError:
+                pass
+            for process in self.processes:
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.terminate()
+            self.processes = []
+        del self.state, self.keys, self.order, self.control
+        self.shm.close()
+        self.shm.unlink()
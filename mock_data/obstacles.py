@@ -0,0 +1,148 @@
+# mock_data/obstacles.py
+
+import numpy as np
+from typing import Sequence, Tuple
+
+# Range of the simulated forward/downward distance sensors (meters)
+SENSOR_RANGE = 10.0
+
+# Distance kept from an obstacle when a move is cut short (meters)
+COLLISION_MARGIN = 0.05
+
+
+class VoxelMap:
+    """
+    Occupancy grid of the environment in twin coordinates (x right,
+    y forward, z up). Voxels outside the grid are free. Rays are cast with
+    a lockstep 3D DDA over all rays at once, so a whole fleet's sensors or
+    move checks cost one batched call per tick.
+    """
+    def __init__(self, occupancy: np.ndarray, origin: Sequence[float], resolution: float):
+        self.occupancy = np.asarray(occupancy, dtype=bool)     # (nx, ny, nz)
+        self.origin = np.asarray(origin, dtype=float)
+        self.resolution = float(resolution)
+        self.shape = np.array(self.occupancy.shape)
+
+    @classmethod
+    def empty(cls, bounds, resolution: float) -> 'VoxelMap':
+        """Free map covering ((xmin, xmax), (ymin, ymax), (zmin, zmax))"""
+        shape = tuple(int(np.ceil((high - low) / resolution)) for low, high in bounds)
+        return cls(np.zeros(shape, dtype=bool), [low for low, _ in bounds], resolution)
+
+    def add_box(self, low: Sequence[float], high: Sequence[float]):
+        """Mark every voxel overlapping an axis-aligned box as occupied"""
+        start = np.floor((np.asarray(low) - self.origin) / self.resolution).astype(int)
+        end = np.ceil((np.asarray(high) - self.origin) / self.resolution).astype(int)
+        start = np.clip(start, 0, self.shape)
+        end = np.clip(end, 0, self.shape)
+        self.occupancy[start[0]:end[0], start[1]:end[1], start[2]:end[2]] = True
+
+    @classmethod
+    def load(cls, path: str) -> 'VoxelMap':
+        """Load a map saved with save()"""
+        data = np.load(path)
+        shape = tuple(data['shape'])
+        occupancy = np.unpackbits(data['bits'], count=int(np.prod(shape))).reshape(shape)
+        return cls(occupancy, data['origin'], float(data['resolution']))
+
+    def save(self, path: str):
+        """Save as a bit-packed .npz file, one bit per voxel"""
+        np.savez_compressed(path, bits=np.packbits(self.occupancy.ravel()),
+                            shape=self.shape, origin=self.origin,
+                            resolution=self.resolution)
+
+    def is_occupied(self, points: np.ndarray) -> np.ndarray:
+        """Occupancy at (N, 3) points"""
+        idx = np.floor((np.atleast_2d(points) - self.origin) / self.resolution).astype(np.intp)
+        inside = ((idx >= 0) & (idx < self.shape)).all(axis=1)
+        result = np.zeros(len(idx), dtype=bool)
+        i = idx[inside]
+        result[inside] = self.occupancy[i[:, 0], i[:, 1], i[:, 2]]
+        return result
+
+    def raycast(self, origins: np.ndarray, directions: np.ndarray,
+                max_range=SENSOR_RANGE) -> np.ndarray:
+        """
+        Distance along each ray to the first occupied voxel.
+        origins, directions: (N, 3); max_range: scalar or (N,).
+        Returns (N,) distances, inf where nothing is hit within range.
+        """
+        origins = np.atleast_2d(np.asarray(origins, dtype=float))
+        directions = np.atleast_2d(np.asarray(directions, dtype=float))
+        n = len(origins)
+        max_range = np.broadcast_to(np.asarray(max_range, dtype=float), (n,))
+        norm = np.linalg.norm(directions, axis=1, keepdims=True)
+        d = directions / np.where(norm > 0, norm, 1.0)
+
+        g = (origins - self.origin) / self.resolution
+        idx = np.floor(g).astype(np.intp)
+        step = np.sign(d).astype(np.intp)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_delta = np.where(d != 0, self.resolution / np.abs(d), np.inf)
+            boundary = np.where(step > 0, idx + 1, idx) * self.resolution + self.origin
+            t_max = np.where(d != 0, (boundary - origins) / d, np.inf)
+
+        distance = np.full(n, np.inf)
+        t = np.zeros(n)
+        active = (norm[:, 0] > 0) & (max_range >= 0)
+        max_steps = int(np.ceil(max_range[active].max() / self.resolution)) * 3 + 3 if active.any() else 0
+        rows = np.arange(n)
+
+        for _ in range(max_steps):
+            if not active.any():
+                break
+            a = rows[active]
+            i = idx[a]
+            inside = ((i >= 0) & (i < self.shape)).all(axis=1)
+            hit = np.zeros(len(a), dtype=bool)
+            hit[inside] = self.occupancy[i[inside, 0], i[inside, 1], i[inside, 2]]
+            distance[a[hit]] = t[a[hit]]
+            active[a[hit]] = False
+
+            # Advance the remaining rays to their next voxel boundary
+            a = a[~hit]
+            axis = np.argmin(t_max[a], axis=1)
+            t[a] = t_max[a, axis]
+            idx[a, axis] += step[a, axis]
+            t_max[a, axis] += t_delta[a, axis]
+            
+            # Rays past their range or heading away from the grid are done
+            i = idx[a]
+            leaving = (((i < 0) & (step[a] <= 0)) | ((i >= self.shape) & (step[a] >= 0))).any(axis=1)
+            active[a[(t[a] > max_range[a]) | leaving]] = False
+
+        distance[distance > max_range] = np.inf
+        return distance
+
+    def downward_range(self, positions: np.ndarray, max_range=SENSOR_RANGE) -> np.ndarray:
+        """Time-of-flight reading below each drone; the ground at height 0 counts"""
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        down = np.broadcast_to([0.0, 0.0, -1.0], positions.shape)
+        # Nothing below the ground, so rays stop there
+        reach = np.minimum(max_range, np.maximum(positions[:, 2], 0.0))
+        distance = np.minimum(self.raycast(positions, down, reach), positions[:, 2])
+        return np.where(distance <= max_range, distance, np.inf)
+
+    def forward_range(self, positions: np.ndarray, yaw: np.ndarray,
+                      max_range=SENSOR_RANGE) -> np.ndarray:
+        """Range ahead of each drone; yaw 0 faces +y and grows clockwise"""
+        yaw = np.radians(np.asarray(yaw, dtype=float))
+        forward = np.stack([np.sin(yaw), np.cos(yaw), np.zeros_like(yaw)], axis=-1)
+        return self.raycast(positions, np.atleast_2d(forward), max_range)
+
+    def sweep(self, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check straight moves from starts to ends, (N, 3) each.
+        Returns (collided, stop) where stop is the last free point before
+        the obstacle, or the end when the move is clear.
+        """
+        starts = np.atleast_2d(np.asarray(starts, dtype=float))
+        ends = np.atleast_2d(np.asarray(ends, dtype=float))
+        delta = ends - starts
+        length = np.linalg.norm(delta, axis=1)
+        distance = self.raycast(starts, delta, length)
+        collided = np.isfinite(distance)
+
+        travel = np.where(collided, np.maximum(distance - COLLISION_MARGIN, 0.0), length)
+        fraction = np.where(length > 0, travel / np.where(length > 0, length, 1.0), 1.0)
+        return collided, starts + fraction[:, None] * delta
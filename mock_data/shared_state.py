@@ -0,0 +1,164 @@
+# mock_data/shared_state.py
+
+import time
+import numpy as np
+from multiprocessing import shared_memory, resource_tracker
+from typing import Dict, List, Optional
+
+# Numeric state columns, in table order
+STATE_FIELDS = (
+    'height', 'speed', 'battery', 'flight_time', 'temp_low',
+    'temp_high', 'x_pos', 'y_pos', 'yaw_angle', 'is_flying'
+)
+
+# Fixed layout:
+#   [0, 64)        int64 header: seq, capacity, n_fields, count, frame
+#   [64, 72)       float64 timestamp of the last publish
+#   [72, ...)      drone ids, ID_BYTES each
+#   [..., end)     float64 state table (capacity, n_fields), 8-byte aligned
+HEADER_SIZE = 64
+TIMESTAMP_OFFSET = HEADER_SIZE
+IDS_OFFSET = 72
+ID_BYTES = 32
+SEQ, CAPACITY, N_FIELDS, COUNT, FRAME = range(5)
+
+# Reader retries before giving up on a consistent snapshot
+MAX_READ_RETRIES = 1000
+
+
+def _table_offset(capacity: int) -> int:
+    end = IDS_OFFSET + capacity * ID_BYTES
+    return (end + 7) // 8 * 8
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to a segment created by another process, leaving its cleanup to the creator"""
+    # Only the creator should unlink the segment. If attaching starts a
+    # private resource tracker it would unlink on exit, so unregister;
+    # processes sharing the creator's tracker leave the registration alone.
+    private_tracker = getattr(resource_tracker._resource_tracker, '_fd', None) is None
+    shm = shared_memory.SharedMemory(name=name)
+    if private_tracker:
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+class SharedStateTable:
+    """
+    Fleet state published into shared memory under a seqlock.
+
+    A single writer bumps the sequence number to odd, writes the frame and
+    bumps it back to even. Readers in other processes copy the table and
+    retry if the sequence was odd or changed meanwhile, so they never block
+    the simulator and never see a half-written frame. Relies on stores
+    becoming visible in program order, which holds on x86 and for numpy
+    element writes issued from one thread.
+    """
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        self.header = np.ndarray((8,), dtype=np.int64, buffer=shm.buf, offset=0)
+        capacity = int(self.header[CAPACITY])
+        n_fields = int(self.header[N_FIELDS])
+        self.timestamp = np.ndarray((1,), dtype=np.float64, buffer=shm.buf, offset=TIMESTAMP_OFFSET)
+        self.ids = np.ndarray((capacity,), dtype=f'S{ID_BYTES}', buffer=shm.buf, offset=IDS_OFFSET)
+        self.table = np.ndarray((capacity, n_fields), dtype=np.float64,
+                                buffer=shm.buf, offset=_table_offset(capacity))
+        self.index: Dict[str, int] = {}
+
+    @classmethod
+    def create(cls, capacity: int, name: Optional[str] = None) -> 'SharedStateTable':
+        """Create a new table owned by the writer process"""
+        size = _table_offset(capacity) + capacity * len(STATE_FIELDS) * 8
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((8,), dtype=np.int64, buffer=shm.buf, offset=0)
+        header[:] = 0
+        header[CAPACITY] = capacity
+        header[N_FIELDS] = len(STATE_FIELDS)
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedStateTable':
+        """Attach to an existing table as a reader"""
+        return cls(attach_shared_memory(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def set_drones(self, drone_ids: List[str]):
+        """Assign table rows to drone ids"""
+        if len(drone_ids) > len(self.ids):
+            raise ValueError(f"Table holds {len(self.ids)} drones, got {len(drone_ids)}")
+        self._begin_write()
+        self.ids[:] = b''
+        self.ids[:len(drone_ids)] = [str(drone_id).encode()[:ID_BYTES] for drone_id in drone_ids]
+        self.header[COUNT] = len(drone_ids)
+        self._end_write()
+        self.index = {drone_id: i for i, drone_id in enumerate(drone_ids)}
+
+    def publish(self, states: np.ndarray, timestamp: Optional[float] = None):
+        """Publish a full (count, n_fields) frame"""
+        count = int(self.header[COUNT])
+        self._begin_write()
+        self.table[:count] = states[:count]
+        self.timestamp[0] = time.time() if timestamp is None else timestamp
+        self.header[FRAME] += 1
+        self._end_write()
+
+    def publish_drones(self, drones: Dict, timestamp: Optional[float] = None):
+        """Publish the state of TelloState objects keyed by drone id"""
+        if list(drones) != list(self.index):
+            self.set_drones(list(drones))
+        # advance() rather than get_state_dict(): update() draws from the
+        # drone's RNG, so publishing would change the run
+        frame = np.empty((len(drones), len(STATE_FIELDS)))
+        for i, state in enumerate(drones.values()):
+            state.advance()
+            frame[i] = [float(getattr(state, field)) for field in STATE_FIELDS]
+        self.publish(frame, timestamp)
+
+    def _begin_write(self):
+        self.header[SEQ] += 1   # odd: write in progress
+
+    def _end_write(self):
+        self.header[SEQ] += 1   # even: frame complete
+
+    def snapshot(self) -> Dict:
+        """
+        Read a consistent copy of the table.
+        Returns: {'frame', 'timestamp', 'ids', 'states'}
+        """
+        for _ in range(MAX_READ_RETRIES):
+            seq = int(self.header[SEQ])
+            if seq % 2:
+                continue
+            count = int(self.header[COUNT])
+            states = self.table[:count].copy()
+            ids = self.ids[:count].copy()
+            frame = int(self.header[FRAME])
+            timestamp = float(self.timestamp[0])
+            if int(self.header[SEQ]) == seq:
+                return {
+                    'frame': frame,
+                    'timestamp': timestamp,
+                    'ids': [drone_id.decode() for drone_id in ids],
+                    'states': states
+                }
+        raise TimeoutError("Writer kept the state table busy")
+
+    def get_state_dict(self, drone_id: str) -> Dict:
+        """Read one drone's state in get_state_dict() form"""
+        snapshot = self.snapshot()
+        row = snapshot['states'][snapshot['ids'].index(drone_id)]
+        state = dict(zip(STATE_FIELDS, row.tolist()))
+        state['is_flying'] = bool(state['is_flying'])
+        return state
+
+    def close(self):
+        """Detach; the owner also frees the segment"""
+        del self.header, self.timestamp, self.ids, self.table
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
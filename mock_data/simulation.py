@@ -0,0 +1,200 @@
+# mock_data/simulation.py
+
+import heapq
+import zlib
+from collections import deque
+import numpy as np
+from typing import Callable, Dict, List, Optional
+import sys
+sys.path.append('..')
+from mock_data.clock import VirtualClock
+from mock_data.states import TelloState
+from mock_data.trajectory import command_trajectory
+from communication.commands import CommandHandler
+
+# Fixed durations of commands that don't depend on a parameter (seconds)
+COMMAND_DURATIONS = {
+    'takeoff': 5.0,
+    'land': 5.0,
+    'emergency': 0.0,
+    'stop': 0.0
+}
+
+# Yaw rate used to time cw/ccw commands (degrees/s)
+ROTATION_RATE = 90.0
+
+MOVEMENT_COMMANDS = ('up', 'down', 'left', 'right', 'forward', 'back')
+
+# Battery level that triggers a battery event (percent)
+BATTERY_LOW = 10
+
+
+def command_duration(state: TelloState, command: str) -> float:
+    """Estimate how long a command keeps the drone busy"""
+    parts = command.split()
+    verb = parts[0]
+    if verb in COMMAND_DURATIONS:
+        return COMMAND_DURATIONS[verb]
+    if verb in ('go', 'curve'):
+        trajectory = command_trajectory([state.x_pos, state.y_pos, state.height], command)
+        if trajectory is None or not np.isfinite(trajectory.duration[0]):
+            return 0.0
+        return float(trajectory.duration[0])
+    try:
+        value = abs(float(parts[1]))
+    except (IndexError, ValueError):
+        return 0.0
+    if verb in MOVEMENT_COMMANDS:
+        return value / max(state.command_speed, 1)
+    if verb in ('cw', 'ccw'):
+        return value / ROTATION_RATE
+    return 0.0
+
+
+class EventSimulator:
+    """
+    Discrete-event core driven by a VirtualClock.
+    Events sit in a priority queue ordered by time and insertion order, and
+    the clock jumps straight to the next one, so idle time costs nothing and
+    runs are deterministic.
+    """
+    def __init__(self, clock: Optional[VirtualClock] = None):
+        self.clock = clock or VirtualClock()
+        self.events = []
+        self.sequence = 0   # tie-breaker keeping same-time events in insertion order
+        self.processed = 0
+
+    def schedule_at(self, timestamp: float, callback: Callable, *args):
+        """Schedule a callback at an absolute virtual time"""
+        self.sequence += 1
+        heapq.heappush(self.events, (max(timestamp, self.clock.time()),
+                                     self.sequence, callback, args))
+
+    def schedule(self, delay: float, callback: Callable, *args):
+        """Schedule a callback delay seconds from now"""
+        self.schedule_at(self.clock.time() + delay, callback, *args)
+
+    def step(self) -> bool:
+        """Run the next event. Returns False when none are left."""
+        if not self.events:
+            return False
+        timestamp, _, callback, args = heapq.heappop(self.events)
+        self.clock.advance_to(timestamp)
+        callback(*args)
+        self.processed += 1
+        return True
+
+    def run_until(self, end_time: float):
+        """Run every event up to end_time, then move the clock there"""
+        while self.events and self.events[0][0] <= end_time:
+            self.step()
+        if end_time > self.clock.time():
+            self.clock.advance_to(end_time)
+
+    def run(self, max_events: Optional[int] = None):
+        """Run until no events are left"""
+        count = 0
+        while (max_events is None or count < max_events) and self.step():
+            count += 1
+
+
+class FleetSimulation:
+    """
+    Event-driven fleet of digital twins sharing one virtual clock.
+    Drones only generate events for command completions, telemetry they
+    opted into and battery thresholds, so mostly idle fleets are cheap.
+    """
+    def __init__(self, seed: int = 0, battery_low: float = BATTERY_LOW, wind=None):
+        self.simulator = EventSimulator()
+        self.wind = wind
+        self.clock = self.simulator.clock
+        self.seed = seed
+        self.battery_low = battery_low
+        self.drones: Dict[str, TelloState] = {}
+        self.handlers: Dict[str, CommandHandler] = {}
+        self.queues: Dict[str, deque] = {}
+        self.busy: Dict[str, bool] = {}
+        self.flight_ids: Dict[str, int] = {}
+        self.listeners: List[Callable] = []
+        self.log = []
+
+    def __getstate__(self):
+        # Listeners are often closures; checkpoints leave them out
+        state = self.__dict__.copy()
+        state['listeners'] = []
+        return state
+
+    def add_drone(self, drone_id: str, telemetry_period: Optional[float] = None) -> TelloState:
+        """Add a drone, optionally emitting telemetry every telemetry_period seconds"""
+        seed = zlib.crc32(f"{self.seed}:{drone_id}".encode())
+        state = TelloState(clock=self.clock, seed=seed, wind=self.wind)
+        self.drones[drone_id] = state
+        self.handlers[drone_id] = CommandHandler(state)
+        self.queues[drone_id] = deque()
+        self.busy[drone_id] = False
+        self.flight_ids[drone_id] = 0
+        if telemetry_period:
+            self.simulator.schedule(telemetry_period, self._emit_telemetry,
+                                    drone_id, telemetry_period)
+        return state
+
+    def add_listener(self, callback: Callable):
+        """Register callback(event, drone_id, data) for simulation events"""
+        self.listeners.append(callback)
+
+    def _notify(self, event: str, drone_id: str, data):
+        self.log.append((self.clock.time(), event, drone_id, data))
+        for callback in self.listeners:
+            callback(event, drone_id, data)
+
+    def submit(self, drone_id: str, command: str):
+        """Queue a command; it starts once the drone is idle"""
+        self.queues[drone_id].append(command)
+        if not self.busy[drone_id]:
+            self._start_next(drone_id)
+
+    def _start_next(self, drone_id: str):
+        if not self.queues[drone_id]:
+            self.busy[drone_id] = False
+            return
+        command = self.queues[drone_id].popleft()
+        self.busy[drone_id] = True
+        duration = command_duration(self.drones[drone_id], command)
+        self.simulator.schedule(duration, self._complete, drone_id, command)
+
+    def _complete(self, drone_id: str, command: str):
+        parts = command.split(' ', 1)
+        params = parts[1] if len(parts) > 1 else None   # go/curve/rc take several values
+        success, message = self.handlers[drone_id].execute_command(parts[0], params)
+        self._notify('command', drone_id, (command, success, message))
+
+        if success and parts[0] == 'takeoff':
+            self._schedule_battery_event(drone_id)
+        self._start_next(drone_id)
+
+    def _schedule_battery_event(self, drone_id: str):
+        self.flight_ids[drone_id] += 1
+        remaining = self.drones[drone_id].time_until_battery(self.battery_low)
+        if remaining is not None:
+            self.simulator.schedule(remaining, self._battery_low, drone_id,
+                                    self.flight_ids[drone_id])
+
+    def _battery_low(self, drone_id: str, flight_id: int):
+        state = self.drones[drone_id]
+        if flight_id != self.flight_ids[drone_id] or not state.is_flying:
+            return  # drone landed since the event was scheduled
+        state.update()
+        self._notify('battery_low', drone_id, state.battery)
+
+    def _emit_telemetry(self, drone_id: str, period: float):
+        self._notify('telemetry', drone_id, self.drones[drone_id].get_state_dict())
+        self.simulator.schedule(period, self._emit_telemetry, drone_id, period)
+
+    def publish_to(self, table, period: float):
+        """Publish every drone's state into a SharedStateTable every period seconds"""
+        table.publish_drones(self.drones, self.clock.time())
+        self.simulator.schedule(period, self.publish_to, table, period)
+
+    def run_until(self, end_time: float):
+        """Advance the whole fleet to end_time"""
+        self.simulator.run_until(end_time)
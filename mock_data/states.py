@@ -1,13 +1,24 @@
 # mock_data/states.py
 
-import time
 import random
 import math
-from dataclasses import dataclass
-from typing import Dict
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 import sys
 sys.path.append('..')
-from config.tello_specs import FLIGHT, VISION
+from config.tello_specs import FLIGHT, VISION, BATTERY
+from mock_data.clock import WallClock
+from mock_data.trajectory import LineTrajectory, ArcTrajectory, body_to_twin, preview
+
+# Battery percent drained per second of flight
+BATTERY_DRAIN = 100 / (BATTERY['FLIGHT_TIME'] * 60)
+
+# Polyline samples used to sweep curve paths for collisions
+PATH_SAMPLES = 32
+
+# Yaw rate at full rc stick deflection (degrees/s)
+RC_YAW_RATE = 100.0
 
 @dataclass
 class TelloState:
@@ -23,24 +34,73 @@ class TelloState:
     x_pos: float = 0.0
     y_pos: float = 0.0
     yaw_angle: float = 0.0
+    command_speed: int = 100     # cm/s, set by the speed command
+    clock: object = field(default=None, repr=False)
+    seed: Optional[int] = None
+    wind: object = field(default=None, repr=False)   # WindField, None flies in still air
+    obstacles: object = field(default=None, repr=False)   # VoxelMap, None is open space
 
     def __post_init__(self):
-        self.start_time = time.time()
+        if self.clock is None:
+            self.clock = WallClock()
+        self.rng = random.Random(self.seed)
+        self.start_time = self.clock.time()
         self.last_update = self.start_time
         self.is_flying = False
+        self.rc = (0, 0, 0, 0)   # left/right, forward/back, up/down, yaw
+        self.trajectory = None   # last go/curve path
+        self.collided = False    # last move was cut short by an obstacle
 
     def update(self):
         """Update drone state"""
+        self.advance()
         if self.is_flying:
-            current_time = time.time()
-            self.flight_time = int(current_time - self.start_time)
-            
             # Update temperature
-            self.temp_low = max(0, min(40, self.temp_low + random.uniform(-0.2, 0.3)))
+            self.temp_low = max(0, min(40, self.temp_low + self.rng.uniform(-0.2, 0.3)))
             self.temp_high = self.temp_low + 3
+
+    def advance(self):
+        """Bring motion, battery and flight time up to now without drawing random numbers"""
+        current_time = self.clock.time()
+        if self.is_flying:
+            self._integrate_rc(current_time - self.last_update)
+            self.flight_time = int(current_time - self.start_time)
             
-            # Small battery drain
-            self.battery = max(0, self.battery - 0.01)
+            # Battery drain over the time since the last update
+            self.battery = max(0, self.battery - (current_time - self.last_update) * BATTERY_DRAIN)
+        self.last_update = current_time
+
+    def _integrate_rc(self, dt: float):
+        """Apply rc stick velocities over dt seconds"""
+        if dt <= 0 or not any(self.rc):
+            return
+        roll, pitch, throttle, yaw = self.rc
+        max_speed = (FLIGHT['MAX_SPEED']['SLOW_MODE'] if self.flight_mode == 'slow'
+                     else FLIGHT['MAX_SPEED']['FAST_MODE']) / 3.6   # km/h -> m/s
+
+        target = np.array([self.x_pos + roll / 100 * max_speed * dt,
+                           self.y_pos + pitch / 100 * max_speed * dt,
+                           self.height + throttle / 100 * max_speed * dt])
+        self.yaw_angle = (self.yaw_angle + yaw / 100 * RC_YAW_RATE * dt) % 360
+        self.speed = math.hypot(roll, pitch) / 100 * max_speed * 3.6
+        self._travel([target + self._wind_drift(dt)])
+
+    def _wind_drift(self, duration: float) -> np.ndarray:
+        """
+        Drift with the wind field over a manoeuvre of duration seconds.
+        Hovering is left alone, the vision position hold rejects the wind.
+        """
+        if self.wind is None or duration <= 0:
+            return np.zeros(3)
+        return self.wind.displacement(
+            [[self.x_pos, self.y_pos, self.height]], self.clock.time(), duration)[0]
+
+    def time_until_battery(self, level: float) -> Optional[float]:
+        """Seconds of flight until the battery drops to level"""
+        self.update()
+        if not self.is_flying or self.battery <= level:
+            return None
+        return (self.battery - level) / BATTERY_DRAIN
 
     def get_state_dict(self) -> Dict:
         """Get current state"""
@@ -64,26 +124,50 @@ class TelloState:
         if not self.is_flying and self.battery > 10:
             self.is_flying = True
             self.height = VISION['HEIGHT_RANGE']['MIN']
-            self.start_time = time.time()
+            self.start_time = self.clock.time()
+            self.last_update = self.start_time
             return True
         return False
 
     def land(self) -> bool:
         """Execute landing"""
         if self.is_flying:
+            self.update()
             self.is_flying = False
+            self.rc = (0, 0, 0, 0)
             self.height = 0.0
             self.speed = 0.0
             return True
         return False
 
+    def emergency_stop(self):
+        """Stop motors immediately"""
+        self.update()
+        self.is_flying = False
+        self.rc = (0, 0, 0, 0)
+        self.height = 0.0
+        self.speed = 0.0
+
+    def set_rc(self, roll: int, pitch: int, throttle: int, yaw: int) -> bool:
+        """Set rc stick values (-100~100), integrated on each update"""
+        if not self.is_flying:
+            return False
+        self.update()   # apply the previous sticks up to now
+        self.rc = (roll, pitch, throttle, yaw)
+        return True
+
+    def set_speed(self, speed: int) -> bool:
+        """Set command speed in cm/s"""
+        self.command_speed = speed
+        return True
+
     def set_height(self, target_height: float) -> bool:
         """Set drone height"""
         if not self.is_flying:
             return False
-        self.height = max(VISION['HEIGHT_RANGE']['MIN'],
-                         min(VISION['HEIGHT_RANGE']['MAX'], target_height))
-        return True
+        target_height = max(VISION['HEIGHT_RANGE']['MIN'],
+                            min(VISION['HEIGHT_RANGE']['MAX'], target_height))
+        return self._travel([[self.x_pos, self.y_pos, target_height]])
 
     def move(self, direction: str, distance: int) -> bool:
         """Move drone in specified direction"""
@@ -91,18 +175,87 @@ class TelloState:
             return False
             
         distance_m = distance / 100  # Convert cm to meters
+        target_x, target_y = self.x_pos, self.y_pos
         
         if direction == 'forward':
-            self.y_pos += distance_m
+            target_y += distance_m
         elif direction == 'back':
-            self.y_pos -= distance_m
+            target_y -= distance_m
         elif direction == 'left':
-            self.x_pos -= distance_m
+            target_x -= distance_m
         elif direction == 'right':
-            self.x_pos += distance_m
+            target_x += distance_m
             
         self.speed = FLIGHT['MAX_SPEED']['SLOW_MODE'] if self.flight_mode == 'slow' else FLIGHT['MAX_SPEED']['FAST_MODE']
-        return True
+        drift = self._wind_drift(distance / max(self.command_speed, 1))
+        return self._travel([np.array([target_x, target_y, self.height]) + drift])
+
+    def go(self, x: int, y: int, z: int, speed: int) -> bool:
+        """Fly straight to a body-frame offset in cm"""
+        if not self.is_flying:
+            return False
+        start = [self.x_pos, self.y_pos, self.height]
+        trajectory = LineTrajectory(start, start + body_to_twin(x, y, z), [speed / 100])
+        return self._follow(trajectory, speed)
+
+    def curve(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, speed: int) -> bool:
+        """Fly an arc through two body-frame offsets in cm"""
+        if not self.is_flying:
+            return False
+        start = [self.x_pos, self.y_pos, self.height]
+        trajectory = ArcTrajectory(start, start + body_to_twin(x1, y1, z1),
+                                   start + body_to_twin(x2, y2, z2), [speed / 100])
+        if not math.isfinite(trajectory.radius[0]):
+            return False
+        return self._follow(trajectory, speed)
+
+    def _follow(self, trajectory, speed: int) -> bool:
+        """Fly a trajectory to its end and keep it for previews"""
+        self.trajectory = trajectory
+        self.speed = speed * 0.036   # cm/s -> km/h
+        if isinstance(trajectory, ArcTrajectory):
+            points = preview(trajectory, samples=PATH_SAMPLES)[0, 1:]
+        else:
+            points = trajectory.end
+        # Spread the drift along the path so the sweep covers it
+        drift = self._wind_drift(float(trajectory.duration[0]))
+        fraction = np.arange(1, len(points) + 1) / len(points)
+        return self._travel(points + fraction[:, None] * drift)
+
+    def _travel(self, points) -> bool:
+        """
+        Fly through a polyline of (K, 3) points, heights clamped to the vision range.
+        Every position change goes through here, wind drift and rc included.
+        Stops short of the first obstacle and returns False if one is hit.
+        """
+        points = np.array(points, dtype=float)
+        points[:, 2] = np.clip(points[:, 2], VISION['HEIGHT_RANGE']['MIN'], VISION['HEIGHT_RANGE']['MAX'])
+        stop = points[-1]
+        self.collided = False
+        
+        if self.obstacles is not None:
+            starts = np.vstack([[self.x_pos, self.y_pos, self.height], points[:-1]])
+            collided, stops = self.obstacles.sweep(starts, points)
+            if collided.any():
+                self.collided = True
+                stop = stops[np.argmax(collided)]
+                
+        self.x_pos, self.y_pos, self.height = stop.tolist()
+        return not self.collided
+
+    def get_range_readings(self) -> Dict:
+        """Simulated downward time-of-flight and forward range in cm, None when out of range"""
+        if not self.is_flying:
+            return {'tof': 0, 'forward': None}
+        position = [[self.x_pos, self.y_pos, self.height]]
+        if self.obstacles is None:
+            return {'tof': int(self.height * 100), 'forward': None}
+        down = float(self.obstacles.downward_range(position)[0])
+        forward = float(self.obstacles.forward_range(position, [self.yaw_angle])[0])
+        return {
+            'tof': int(down * 100) if math.isfinite(down) else None,
+            'forward': int(forward * 100) if math.isfinite(forward) else None
+        }
 
     def rotate(self, direction: str, angle: int) -> bool:
         """Rotate drone"""
@@ -0,0 +1,110 @@
+# mock_data/trajectory.py
+
+import numpy as np
+from typing import Optional
+
+# Offsets of go/curve are given in the Tello body frame in cm:
+# x forward, y left, z up. The twin uses x_pos right, y_pos forward, height up.
+
+
+def body_to_twin(x, y, z) -> np.ndarray:
+    """Convert body-frame cm offsets to twin-frame meters, shape (..., 3)"""
+    x, y, z = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (x, y, z)))
+    return np.stack([-y, x, z], axis=-1) / 100
+
+
+class LineTrajectory:
+    """
+    Straight-line flights for M drones at once (the go command).
+    start and end are (M, 3) meters, speed is (M,) m/s.
+    """
+    def __init__(self, start, end, speed):
+        self.start = np.atleast_2d(np.asarray(start, dtype=float))
+        self.end = np.atleast_2d(np.asarray(end, dtype=float))
+        self.delta = self.end - self.start
+        self.length = np.linalg.norm(self.delta, axis=1)
+        self.duration = self.length / np.asarray(speed, dtype=float)
+
+    def evaluate(self, times) -> np.ndarray:
+        """Positions at the given times (T,) since start. Returns (M, T, 3)."""
+        s = _progress(np.asarray(times, dtype=float), self.duration)
+        return self.start[:, None, :] + s[:, :, None] * self.delta[:, None, :]
+
+
+class ArcTrajectory:
+    """
+    Circular arcs through three points for M drones at once (the curve command).
+    start, mid and end are (M, 3) meters, speed is (M,) m/s.
+    Collinear points give an infinite radius.
+    """
+    def __init__(self, start, mid, end, speed):
+        self.start = np.atleast_2d(np.asarray(start, dtype=float))
+        self.end = np.atleast_2d(np.asarray(end, dtype=float))
+        a = np.atleast_2d(np.asarray(mid, dtype=float)) - self.start
+        b = self.end - self.start
+        normal = np.cross(a, b)
+        normal_sq = np.einsum('ij,ij->i', normal, normal)
+        valid = normal_sq > 1e-12
+        safe_sq = np.where(valid, normal_sq, 1.0)
+
+        # Circumcenter relative to start
+        offset = np.cross(np.einsum('ij,ij->i', a, a)[:, None] * b
+                          - np.einsum('ij,ij->i', b, b)[:, None] * a, normal) / (2 * safe_sq[:, None])
+        self.center = self.start + offset
+        self.radius = np.where(valid, np.linalg.norm(offset, axis=1), np.inf)
+
+        # Orthonormal basis of the arc plane, rotating start toward mid and end
+        safe_radius = np.where(valid, self.radius, 1.0)
+        self.u = -offset / safe_radius[:, None]
+        w = normal / np.sqrt(safe_sq)[:, None]
+        self.v = np.cross(w, self.u)
+
+        rel_end = self.end - self.center
+        self.span = np.mod(np.arctan2(np.einsum('ij,ij->i', rel_end, self.v),
+                                      np.einsum('ij,ij->i', rel_end, self.u)), 2 * np.pi)
+        self.length = np.where(valid, safe_radius * self.span, np.inf)
+        self.duration = self.length / np.asarray(speed, dtype=float)
+
+    def evaluate(self, times) -> np.ndarray:
+        """Positions at the given times (T,) since start. Returns (M, T, 3)."""
+        s = _progress(np.asarray(times, dtype=float), self.duration)
+        angle = s * self.span[:, None]
+        return (self.center[:, None, :]
+                + self.radius[:, None, None] * (np.cos(angle)[:, :, None] * self.u[:, None, :]
+                                                + np.sin(angle)[:, :, None] * self.v[:, None, :]))
+
+
+def _progress(times: np.ndarray, duration: np.ndarray) -> np.ndarray:
+    """Fraction of each trajectory completed at each time, shape (M, T)"""
+    duration = np.where(duration > 0, duration, 1.0)
+    return np.clip(times[None, :] / duration[:, None], 0.0, 1.0)
+
+
+def command_trajectory(position, command: str):
+    """
+    Build the trajectory of a go/curve command starting at position (x, y, height).
+    Returns None for other commands.
+    """
+    parts = command.split()
+    verb = parts[0]
+    try:
+        values = [float(value) for value in parts[1:]]
+    except ValueError:
+        return None
+    start = np.asarray(position, dtype=float)
+
+    if verb == 'go' and len(values) == 4:
+        x, y, z, speed = values
+        return LineTrajectory(start, start + body_to_twin(x, y, z), [speed / 100])
+    if verb == 'curve' and len(values) == 7:
+        x1, y1, z1, x2, y2, z2, speed = values
+        return ArcTrajectory(start, start + body_to_twin(x1, y1, z1),
+                             start + body_to_twin(x2, y2, z2), [speed / 100])
+    return None
+
+
+def preview(trajectory, samples: int = 50, duration: Optional[float] = None) -> np.ndarray:
+    """Sample a trajectory evenly in time. Returns (M, samples, 3)."""
+    if duration is None:
+        duration = float(np.max(np.where(np.isfinite(trajectory.duration), trajectory.duration, 0)))
+    return trajectory.evaluate(np.linspace(0, duration, samples))
@@ -0,0 +1,124 @@
+# mock_data/wind.py
+
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+# Fraction of the wind the Tello's position hold fails to reject
+DRIFT_FACTOR = 0.3
+
+# Default field extent in twin coordinates (meters): x, y, height
+DEFAULT_BOUNDS = ((-50.0, 50.0), (-50.0, 50.0), (0.0, 10.0))
+DEFAULT_SPACING = 1.0    # meters between grid nodes
+
+# Wind shear: v(z) = v_ref * (z / REFERENCE_HEIGHT) ** SHEAR_EXPONENT
+REFERENCE_HEIGHT = 10.0  # meters
+SHEAR_EXPONENT = 1 / 7
+
+
+class WindField:
+    """
+    Precomputed 3D wind grid (m/s in twin axes: x right, y forward, z up)
+    with an optional spatially uniform gust time series on top.
+    Sampling is trilinear over an (N, 3) array of positions, so one call
+    serves the whole fleet and per-drone cost stays flat.
+    """
+    def __init__(self, grid: np.ndarray, origin: Sequence[float], spacing: float,
+                 drift_factor: float = DRIFT_FACTOR):
+        self.grid = np.asarray(grid, dtype=float)           # (nx, ny, nz, 3)
+        self.origin = np.asarray(origin, dtype=float)
+        self.spacing = float(spacing)
+        self.shape = np.array(self.grid.shape[:3])
+        self.drift_factor = drift_factor
+        self.gust_times = None
+        self.gust_vectors = None
+
+    @classmethod
+    def uniform(cls, velocity: Sequence[float], bounds=DEFAULT_BOUNDS,
+                spacing: float = DEFAULT_SPACING) -> 'WindField':
+        """Same wind everywhere"""
+        shape = _grid_shape(bounds, spacing)
+        grid = np.broadcast_to(np.asarray(velocity, dtype=float), shape + (3,)).copy()
+        return cls(grid, [low for low, _ in bounds], spacing)
+
+    @classmethod
+    def from_profile(cls, velocity: Sequence[float], turbulence: float = 0.0,
+                     seed: Optional[int] = None, bounds=DEFAULT_BOUNDS,
+                     spacing: float = DEFAULT_SPACING) -> 'WindField':
+        """
+        Horizontal wind following the power-law shear profile, with optional
+        Gaussian turbulence (m/s standard deviation) frozen into the grid.
+        velocity is the wind at REFERENCE_HEIGHT.
+        """
+        shape = _grid_shape(bounds, spacing)
+        heights = bounds[2][0] + np.arange(shape[2]) * spacing
+        scale = (np.maximum(heights, 0.1) / REFERENCE_HEIGHT) ** SHEAR_EXPONENT
+        grid = scale[None, None, :, None] * np.asarray(velocity, dtype=float)
+        grid = np.broadcast_to(grid, shape + (3,)).copy()
+        if turbulence:
+            rng = np.random.default_rng(seed)
+            grid += rng.normal(0.0, turbulence, grid.shape)
+        return cls(grid, [low for low, _ in bounds], spacing)
+
+    @classmethod
+    def load(cls, path: str) -> 'WindField':
+        """Load a field saved with save()"""
+        data = np.load(path)
+        field = cls(data['grid'], data['origin'], float(data['spacing']),
+                    float(data['drift_factor']))
+        if 'gust_times' in data:
+            field.set_gusts(data['gust_times'], data['gust_vectors'])
+        return field
+
+    def save(self, path: str):
+        """Save the field as a compressed .npz file"""
+        arrays = {
+            'grid': self.grid,
+            'origin': self.origin,
+            'spacing': self.spacing,
+            'drift_factor': self.drift_factor
+        }
+        if self.gust_times is not None:
+            arrays['gust_times'] = self.gust_times
+            arrays['gust_vectors'] = self.gust_vectors
+        np.savez_compressed(path, **arrays)
+
+    def set_gusts(self, times: Sequence[float], vectors: Sequence[Sequence[float]]):
+        """Add a gust time series, linearly interpolated and held at the ends"""
+        self.gust_times = np.asarray(times, dtype=float)
+        self.gust_vectors = np.asarray(vectors, dtype=float).reshape(-1, 3)
+
+    def gust(self, t: float) -> np.ndarray:
+        """Gust vector at time t"""
+        if self.gust_times is None:
+            return np.zeros(3)
+        return np.array([np.interp(t, self.gust_times, self.gust_vectors[:, axis])
+                         for axis in range(3)])
+
+    def sample(self, positions: np.ndarray, t: float = 0.0) -> np.ndarray:
+        """Wind at (N, 3) positions and time t. Returns (N, 3) m/s."""
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        g = (positions - self.origin) / self.spacing
+        g = np.clip(g, 0.0, self.shape - 1)
+        i0 = np.minimum(np.floor(g).astype(np.intp), np.maximum(self.shape - 2, 0))
+        i1 = np.minimum(i0 + 1, self.shape - 1)
+        f = g - i0
+
+        x0, y0, z0 = i0.T
+        x1, y1, z1 = i1.T
+        fx, fy, fz = (f[:, axis, None] for axis in range(3))
+
+        c00 = self.grid[x0, y0, z0] * (1 - fx) + self.grid[x1, y0, z0] * fx
+        c10 = self.grid[x0, y1, z0] * (1 - fx) + self.grid[x1, y1, z0] * fx
+        c01 = self.grid[x0, y0, z1] * (1 - fx) + self.grid[x1, y0, z1] * fx
+        c11 = self.grid[x0, y1, z1] * (1 - fx) + self.grid[x1, y1, z1] * fx
+        c0 = c00 * (1 - fy) + c10 * fy
+        c1 = c01 * (1 - fy) + c11 * fy
+        return c0 * (1 - fz) + c1 * fz + self.gust(t)
+
+    def displacement(self, positions: np.ndarray, t: float, dt: float) -> np.ndarray:
+        """Drift of drones holding position at (N, 3) positions for dt seconds"""
+        return self.sample(positions, t) * (self.drift_factor * dt)
+
+
+def _grid_shape(bounds, spacing: float) -> Tuple[int, int, int]:
+    return tuple(int(round((high - low) / spacing)) + 1 for low, high in bounds)
@@ -0,0 +1,99 @@
+# tests/test_bridge.py
+
+import socket
+import threading
+import time
+from communication.bridge import TelloBridge
+from mock_data.states import TelloState
+
+class FakeDrone:
+    """UDP endpoint answering like a Tello; forward replies wait for release"""
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.port = self.sock.getsockname()[1]
+        self.received = []
+        self.release = threading.Event()
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def serve(self):
+        while True:
+            try:
+                data, address = self.sock.recvfrom(1024)
+            except OSError:
+                return
+            command = data.decode()
+            self.received.append(command)
+            if command.startswith('forward'):
+                threading.Thread(target=self.reply_later, args=(address,), daemon=True).start()
+            else:
+                self.sock.sendto(b'ok', address)
+
+    def reply_later(self, address):
+        self.release.wait(5)
+        self.sock.sendto(b'ok', address)
+
+def wait_for(condition, timeout=2.0):
+    end = time.perf_counter() + timeout
+    while not condition():
+        assert time.perf_counter() < end
+        time.sleep(0.01)
+
+def test_dispatch_with_tello_state():
+    tello = TelloState()
+    bridge = TelloBridge(tello)
+    bridge.start_command_dispatch()
+    bridge.queue_command('takeoff')
+    bridge.queue_command('forward 100')
+    assert bridge.response_queue.get(timeout=2)['response']['simulator'] == (True, "Takeoff successful")
+    assert bridge.response_queue.get(timeout=2)['response']['simulator'][0] is True
+    assert tello.y_pos == 1.0
+
+def test_failed_send_keeps_lane_alive():
+    bridge = TelloBridge(TelloState())
+    execute = bridge.handler.execute_command
+    calls = []
+    def fail_once(command, params=None):
+        calls.append(command)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return execute(command, params)
+    bridge.handler.execute_command = fail_once
+
+    bridge.start_command_dispatch()
+    bridge.queue_command('takeoff')
+    assert 'RuntimeError' in bridge.response_queue.get(timeout=2)['response']['error']
+    bridge.queue_command('takeoff')
+    assert bridge.response_queue.get(timeout=2)['response']['simulator'][0] is True
+
+def test_priority_not_blocked_by_reply():
+    drone = FakeDrone()
+    bridge = TelloBridge(TelloState())
+    try:
+        assert bridge.connect_real_drone('127.0.0.1', drone.port, local_port=0)
+        bridge.start_command_dispatch()
+        bridge.queue_command('forward 100')
+        wait_for(lambda: 'forward 100' in drone.received)
+
+        # stop goes out while forward still waits for its reply
+        bridge.queue_command('stop')
+        bridge.queue_command('left 50')
+        wait_for(lambda: 'stop' in drone.received)
+
+        # Both replies have to arrive before the next move is sent
+        time.sleep(0.2)
+        assert 'left 50' not in drone.received
+        drone.release.set()
+        wait_for(lambda: 'left 50' in drone.received)
+        commands = [bridge.response_queue.get(timeout=2)['command'] for _ in range(3)]
+        assert sorted(commands) == ['forward 100', 'left 50', 'stop']
+    finally:
+        drone.release.set()
+        bridge.real_drone.close()
+        drone.sock.close()
+
+if __name__ == "__main__":
+    test_dispatch_with_tello_state()
+    test_failed_send_keeps_lane_alive()
+    test_priority_not_blocked_by_reply()
+    print("Bridge tests passed")
@@ -0,0 +1,82 @@
+# tests/test_checkpoint.py
+
+import os
+import pathlib
+import pickle
+import tempfile
+import time
+import pytest
+from mock_data.checkpoint import fork, load_checkpoint, save_checkpoint, MAGIC, VERSION
+from mock_data.clock import VirtualClock
+from mock_data.simulation import FleetSimulation
+from mock_data.wind import WindField
+from utils.tracing import Tracer
+
+def warm_fleet():
+    fleet = FleetSimulation(seed=7, wind=WindField.from_profile([2.0, 0.0, 0.0], turbulence=0.3, seed=1))
+    for i in range(100):
+        fleet.add_drone(f"drone{i}", telemetry_period=30)
+        for command in ["takeoff", "up 100", "forward 200", "cw 90", "forward 100"]:
+            fleet.submit(f"drone{i}", command)
+    fleet.run_until(6)   # partway through the setup, commands still queued
+    return fleet
+
+def test_restore_continues_identically(tmp_path):
+    fleet = warm_fleet()
+    
+    start = time.perf_counter()
+    data = save_checkpoint(fleet, path=str(tmp_path / "warm.ckpt"))
+    restored = load_checkpoint(str(tmp_path / "warm.ckpt"))
+    assert time.perf_counter() - start < 1.0
+    
+    assert restored.clock.time() == 6
+    assert restored.drones["drone3"].rng.getstate() == fleet.drones["drone3"].rng.getstate()
+    
+    fleet.run_until(600)
+    restored.run_until(600)
+    assert restored.log == fleet.log
+    assert restored.drones["drone3"].get_state_dict() == fleet.drones["drone3"].get_state_dict()
+    assert load_checkpoint(data).clock.time() == 6
+
+def test_fork_shares_environment():
+    fleet = warm_fleet()
+    events = []
+    fleet.add_listener(events.append)
+    
+    branch = fork(fleet, seed=99)
+    assert branch.wind is fleet.wind
+    assert branch.drones["drone0"].wind is fleet.wind
+    assert branch.listeners == []
+    
+    branch.run_until(60)
+    assert fleet.clock.time() == 6   # original untouched
+    assert branch.drones["drone0"].battery < fleet.drones["drone0"].battery
+
+class Exploit:
+    def __reduce__(self):
+        return (os.system, ("echo pwned",))
+
+class GetattrExploit:
+    def __reduce__(self):
+        return (getattr, (VirtualClock(), "__init__"))
+
+class NewTracer:
+    def __reduce__(self):
+        return (Tracer, ())
+
+class MethodExploit:
+    def __reduce__(self):
+        return (getattr, (NewTracer(), "export"))
+
+def test_untrusted_globals_are_refused():
+    for payload in (Exploit(), GetattrExploit(), MethodExploit()):
+        data = MAGIC + bytes([VERSION]) + pickle.dumps(payload)
+        with pytest.raises(pickle.UnpicklingError):
+            load_checkpoint(data)
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        test_restore_continues_identically(pathlib.Path(tmp))
+    test_fork_shares_environment()
+    test_untrusted_globals_are_refused()
+    print("Checkpoint tests passed")
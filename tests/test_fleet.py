@@ -0,0 +1,104 @@
+# tests/test_fleet.py
+
+import numpy as np
+from mock_data.fleet import (ShardedFleet, shard_bounds,
+                             X, Y, Z, VX, VY, FLYING, COLLIDED, NEAREST, PROXIMITY_RADIUS)
+from mock_data.states import TelloState
+from mock_data.clock import VirtualClock
+from mock_data.wind import WindField
+from mock_data.obstacles import VoxelMap
+
+def make_fleet(count, workers, wind=None, obstacles=None):
+    fleet = ShardedFleet(count, workers=workers, wind=wind, obstacles=obstacles)
+    rng = np.random.default_rng(3)
+    fleet.state[:, X:Z + 1] = rng.uniform([-40, -40, 1], [40, 40, 9], (count, 3))
+    fleet.state[:, VX:VY + 1] = rng.uniform(-2, 2, (count, 2))
+    fleet.state[:, FLYING] = 1.0
+    return fleet
+
+def scenario():
+    wind = WindField.from_profile([1.5, -0.5, 0.0], turbulence=0.3, seed=1)
+    wind.set_gusts([0, 5, 10], [[0, 0, 0], [1, 1, 0], [0, 0, 0]])
+    obstacles = VoxelMap.empty(((-50, 50), (-50, 50), (0, 10)), 0.5)
+    obstacles.add_box([-5, -5, 0], [5, 5, 10])
+    return wind, obstacles
+
+def test_shard_bounds():
+    assert shard_bounds(10, 3) == [(0, 3), (3, 7), (7, 10)]
+    assert shard_bounds(2, 1) == [(0, 2)]
+
+def test_sharded_run_matches_single_process():
+    wind, obstacles = scenario()
+    results = []
+    for workers in (0, 3):
+        fleet = make_fleet(3000, workers, wind, obstacles)
+        try:
+            fleet.run(20)
+            fleet.run(5)
+            results.append(fleet.snapshot())
+        finally:
+            fleet.close()
+    single, sharded = results
+    assert np.array_equal(single, sharded)
+    assert single[:, COLLIDED].any()
+    assert np.isfinite(single[:, NEAREST]).any()
+
+def test_nearest_neighbour_matches_brute_force():
+    fleet = make_fleet(500, 0)
+    fleet.state[::7, FLYING] = 0.0
+    try:
+        fleet.run(1)
+        state = fleet.snapshot()
+    finally:
+        fleet.close()
+    flying = state[:, FLYING] > 0
+    positions = state[:, X:Z + 1]
+    distance = np.linalg.norm(positions[:, None] - positions[None], axis=2)
+    distance[~flying] = np.inf
+    distance[:, ~flying] = np.inf
+    np.fill_diagonal(distance, np.inf)
+    expected = distance.min(axis=1)
+    expected[expected > PROXIMITY_RADIUS] = np.inf
+    assert np.allclose(state[:, NEAREST], expected)
+
+def test_load_drones():
+    clock = VirtualClock()
+    drones = {"drone0": TelloState(clock=clock), "drone1": TelloState(clock=clock)}
+    drones["drone1"].take_off()
+    drones["drone1"].set_rc(0, 50, 0, 0)
+    fleet = ShardedFleet(4)
+    try:
+        assert fleet.load_drones(drones) == ["drone0", "drone1"]
+        fleet.run(10)
+        clock.advance(1.0)
+        drones["drone1"].update()
+        assert fleet.state[0, FLYING] == 0.0
+        assert np.isclose(fleet.state[1, Y], drones["drone1"].y_pos)
+    finally:
+        fleet.close()
+
+def test_workers_persist_across_runs():
+    fleet = make_fleet(2000, 2)
+    reference = make_fleet(2000, 0)
+    try:
+        fleet.run(3)
+        pids = [process.pid for process in fleet.processes]
+        fleet.run(3)
+        assert [process.pid for process in fleet.processes] == pids
+        assert all(process.is_alive() for process in fleet.processes)
+        assert fleet.tick == 6
+
+        reference.run(6)
+        assert np.array_equal(fleet.snapshot(), reference.snapshot())
+    finally:
+        fleet.close()
+        reference.close()
+    assert not fleet.processes
+
+if __name__ == "__main__":
+    test_shard_bounds()
+    test_sharded_run_matches_single_process()
+    test_nearest_neighbour_matches_brute_force()
+    test_load_drones()
+    test_workers_persist_across_runs()
+    print("Fleet tests passed")
@@ -0,0 +1,37 @@
+# tests/test_fleet_visualizer.py
+
+import numpy as np
+from utils.visualizer import TelloVisualizer
+
+def test_fleet_view():
+    viz = TelloVisualizer()
+    traces_before = len(viz.fig.data)
+    viz.setup_fleet_view([f"drone{i}" for i in range(1000)], path_length=10)
+    
+    # Two traces regardless of fleet size
+    assert len(viz.fig.data) == traces_before + 2
+    
+    rng = np.random.default_rng(0)
+    positions = np.zeros((1000, 3))
+    for step in range(15):
+        positions += rng.uniform(-0.1, 0.1, (1000, 3))
+        viz.update_fleet(positions, np.full(1000, step * 10.0))
+        
+    markers = viz.fig.data[viz.fleet_marker_trace]
+    assert len(markers.x) == 1000
+    assert markers.customdata[5][0] == 'drone5'
+    assert markers.customdata[5][1] == 140.0
+    
+    # 10 path points plus one NaN separator per drone, newest last
+    path = viz.fig.data[viz.fleet_path_trace]
+    assert len(path.x) == 1000 * 11
+    assert np.isnan(path.x[10])
+    assert path.x[9] == positions[0, 0]
+    
+    # Single drone view is untouched
+    viz.update_position(1, 2, 3, 90, 0)
+    assert len(viz.fig.data[viz.fleet_path_trace].x) == 1000 * 11
+
+if __name__ == "__main__":
+    test_fleet_view()
+    print("Fleet visualizer tests passed")
@@ -0,0 +1,88 @@
+# tests/test_flight_index.py
+
+import time
+import numpy as np
+from utils.flight_index import FlightIndex
+
+def build_index(n_tracks=50, n_samples=2000):
+    index = FlightIndex()
+    rng = np.random.default_rng(0)
+    t = np.arange(n_samples) * 0.5
+    for i in range(n_tracks):
+        # Straight lines at separate altitudes, far apart
+        start = rng.uniform(-100, 100, 2)
+        velocity = rng.uniform(-1, 1, 2)
+        for k in range(n_samples):
+            x, y = start + velocity * t[k]
+            index.record(f"drone{i}", t[k], x, y, 10.0 + 3 * i)
+    return index
+
+def test_position_at():
+    index = FlightIndex()
+    index.record("drone7", 0.0, 0.0, 0.0, 1.0)
+    index.record("drone7", 2.0, 2.0, 4.0, 1.0)
+    index.record("drone7", 30.0, 2.0, 4.0, 3.0)
+    assert index.position_at("drone7", 1.0) == (1.0, 2.0, 1.0)
+    assert index.position_at("drone7", 16.0) == (2.0, 4.0, 2.0)
+    assert index.position_at("drone7", 31.0) is None
+    assert index.position_at("drone8", 1.0) is None
+
+def test_tracks_in_box():
+    index = FlightIndex()
+    for k in range(100):
+        index.record("a", k, k, 0.0, 1.0)        # crosses x = 50 at t = 50
+        index.record("b", k, 0.0, k, 1.0)        # stays at x = 0
+    assert index.tracks_in_box([49.5, -1, 0], [52, 1, 2]) == {"a": 50.0}
+    assert index.tracks_in_box([-1, -1, 0], [1, 1, 2]) == {"a": 0.0, "b": 0.0}
+    assert index.tracks_in_box([-1, 10, 0], [1, 20, 2], t0=15) == {"b": 15.0}
+
+def test_huge_and_unbounded_boxes():
+    index = FlightIndex()
+    for k in range(100):
+        index.record("a", k, k, 0.0, 1.0)
+    start = time.perf_counter()
+    assert index.tracks_in_box([-5000, -5000, 0], [5000, 5000, 10]) == {"a": 0.0}
+    assert index.tracks_in_box([-np.inf] * 3, [np.inf] * 3) == {"a": 0.0}
+    assert index.tracks_in_box([200, 200, 0], [np.inf, np.inf, 10]) == {}
+    assert time.perf_counter() - start < 0.05
+
+def test_closest_approach():
+    index = FlightIndex()
+    for k in range(101):
+        t = k * 1.0
+        index.record("east", t, -50 + t, 0.0, 5.0)
+        index.record("north", t, 0.0, -49.5 + t, 6.0)
+        index.record("far", t, 500.0, 500.0, 5.0)
+    distance, when, a, b = index.closest_approach()
+    assert {a, b} == {"east", "north"}
+    # Closest between samples: relative path crosses nearest at t = 49.75
+    assert abs(when - 49.75) < 1e-9
+    assert abs(distance - np.sqrt(0.25 ** 2 * 2 + 1)) < 1e-9
+
+def test_closest_approach_beyond_a_cell():
+    # Tracks 25m apart and diverging: no pair shares or neighbours a grid cell
+    index = FlightIndex(cell_size=10.0)
+    for k in range(60):
+        index.record("a", k, k * 0.5, 0.0, 5.0)
+        index.record("b", k, k * 0.5, 25.0 + k * 0.1, 5.0)
+    distance, when, a, b = index.closest_approach()
+    assert {a, b} == {"a", "b"}
+    assert (distance, when) == (25.0, 0.0)
+    assert abs(index.closest_approach(t0=30)[0] - 28.0) < 1e-9
+
+def test_queries_are_fast():
+    index = build_index()
+    start = time.perf_counter()
+    index.position_at("drone7", 503.2)
+    index.tracks_in_box([0, 0, 0], [10, 10, 200])
+    index.closest_approach()
+    assert time.perf_counter() - start < 0.05
+
+if __name__ == "__main__":
+    test_position_at()
+    test_tracks_in_box()
+    test_huge_and_unbounded_boxes()
+    test_closest_approach()
+    test_closest_approach_beyond_a_cell()
+    test_queries_are_fast()
+    print("Flight index tests passed")
@@ -0,0 +1,78 @@
+# tests/test_fusion.py
+
+import numpy as np
+from communication.fusion import FleetKalmanFilter, parse_tello_state
+from communication.bridge import TelloBridge
+from mock_data.states import TelloState
+from mock_data.clock import VirtualClock
+
+def test_parse_tello_state():
+    state = parse_tello_state("mid:1;x:50;y:-20;z:100;pitch:0;roll:0;yaw:-90;"
+                              "vgx:5;vgy:0;vgz:0;templ:60;temph:63;h:120;bat:80;\r\n")
+    assert state['x'] == 0.5
+    assert state['y'] == -0.2
+    assert state['z'] == 1.2
+    assert state['vx'] == 0.5
+    assert state['yaw'] == 270
+
+    # No mission pad, no absolute position
+    assert 'x' not in parse_tello_state("mid:-1;x:0;y:0;yaw:0;h:30;")
+
+def test_filter_converges_for_fleet():
+    fleet = FleetKalmanFilter([f"drone{i}" for i in range(100)])
+    truth = np.random.default_rng(0).uniform(-5, 5, (100, 7))
+    truth[:, 6] = 10.0
+    observed = np.ones((100, 7), dtype=bool)
+
+    for _ in range(50):
+        fleet.predict(0.1)
+        truth[:, 0:3] += truth[:, 3:6] * 0.1
+        fleet.update(truth, observed)
+
+    assert np.abs(fleet.x[:, 0:3] - truth[:, 0:3]).max() < 0.2
+    assert not fleet.diverged.any()
+
+def test_bridge_flags_divergence():
+    tello = TelloState()
+    tello.take_off()
+    bridge = TelloBridge(tello)
+
+    metrics = bridge.synchronize_states(tello.get_state_dict(), "mid:1;x:300;y:0;z:30;yaw:0;h:30;")
+    assert metrics['diverged']
+    assert 0 < tello.x_pos < 3.0   # pulled toward the real drone
+
+    assert metrics['divergences'] == 1
+    assert bridge.synchronize_states(tello.get_state_dict(), None) is None
+
+def test_bridge_uses_twin_clock():
+    clock = VirtualClock(start=100.0)
+    tello = TelloState(clock=clock)
+    tello.take_off()
+    bridge = TelloBridge(tello)
+
+    bridge.synchronize_states(tello.get_state_dict(), "mid:1;x:300;y:0;z:30;yaw:0;h:30;")
+    clock.advance(2.0)
+    bridge.synchronize_states(tello.get_state_dict(), "mid:1;x:300;y:0;z:30;yaw:0;h:30;")
+    assert bridge.last_sync == 102.0
+    assert bridge.sync_metrics['divergences'] >= 1
+
+def test_no_drift_when_twin_matches_drone():
+    # Twin on rc at 1 m/s forward, real drone reports the same velocity
+    clock = VirtualClock()
+    tello = TelloState(clock=clock)
+    tello.take_off()
+    tello.set_rc(0, 25, 0, 0)
+    bridge = TelloBridge(tello)
+
+    for _ in range(50):
+        clock.advance(0.1)
+        bridge.synchronize_states(tello.get_state_dict(), "mid:-1;vgx:0;vgy:10;vgz:0;yaw:0;h:30;")
+    assert abs(tello.y_pos - 5.0) < 0.2
+
+if __name__ == "__main__":
+    test_parse_tello_state()
+    test_filter_converges_for_fleet()
+    test_bridge_flags_divergence()
+    test_bridge_uses_twin_clock()
+    test_no_drift_when_twin_matches_drone()
+    print("Fusion tests passed")
@@ -0,0 +1,91 @@
+# tests/test_obstacles.py
+
+import pathlib
+import tempfile
+import numpy as np
+from mock_data.clock import VirtualClock
+from mock_data.obstacles import VoxelMap
+from mock_data.states import TelloState
+from mock_data.wind import WindField
+
+def make_room():
+    # 20m x 20m x 5m space with a wall at y = 5..5.5 and a 1m table
+    room = VoxelMap.empty(((-10, 10), (-10, 10), (0, 5)), resolution=0.1)
+    room.add_box([-10, 5, 0], [10, 5.5, 5])
+    room.add_box([2, -1, 0], [4, 1, 1])
+    return room
+
+def test_raycast():
+    room = make_room()
+    origins = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, 1.0], [3.0, 0.0, 2.0], [0.0, 0.0, 0.5]])
+    directions = np.array([[0, 1, 0], [0, -1, 0], [0, 0, -1], [1, 0, 0]])
+    distance = room.raycast(origins, directions, max_range=10.0)
+    assert np.isclose(distance[0], 5.0)
+    assert np.isinf(distance[1])
+    assert np.isclose(distance[2], 1.0)
+    assert np.isclose(distance[3], 2.0)
+    
+    # Ground counts for the downward sensor, the table top too
+    tof = room.downward_range([[0, 0, 1.5], [3, 0, 1.5]])
+    assert np.allclose(tof, [1.5, 0.5])
+    assert np.isclose(room.forward_range([[0, 0, 1]], [0])[0], 5.0)
+    assert np.isclose(room.forward_range([[0, 0, 0.5]], [90])[0], 2.0)
+
+def test_save_load(tmp_path):
+    room = make_room()
+    path = str(tmp_path / "room.npz")
+    room.save(path)
+    loaded = VoxelMap.load(path)
+    assert (loaded.occupancy == room.occupancy).all()
+    assert loaded.resolution == room.resolution
+
+def test_move_stops_at_wall():
+    tello = TelloState(clock=VirtualClock(), obstacles=make_room())
+    tello.take_off()
+    tello.set_height(2.0)
+    
+    assert tello.move('forward', 300) is True
+    assert tello.move('forward', 300) is False
+    assert tello.collided
+    assert 4.9 <= tello.y_pos < 5.0
+    assert tello.get_range_readings()['forward'] <= 10
+    assert tello.get_range_readings()['tof'] == 200
+
+def test_wind_and_rc_cannot_pass_walls():
+    # Tailwind drift is swept along with the move
+    tello = TelloState(clock=VirtualClock(), obstacles=make_room(),
+                       wind=WindField.uniform([0.0, 5.0, 0.0]))
+    tello.take_off()
+    tello.set_height(2.0)
+    assert tello.move('forward', 480) is False
+    assert tello.collided
+    assert tello.y_pos < 5.0
+
+    # So are rc stick updates
+    clock = VirtualClock()
+    tello = TelloState(clock=clock, obstacles=make_room())
+    tello.take_off()
+    tello.set_height(2.0)
+    tello.set_rc(0, 100, 0, 0)
+    clock.advance(3.0)
+    tello.update()
+    assert tello.collided
+    assert tello.y_pos < 5.0
+
+def test_fleet_sweep():
+    room = make_room()
+    rng = np.random.default_rng(0)
+    starts = rng.uniform([-9, -9, 1.5], [9, 4, 4], (5000, 3))
+    ends = starts + np.array([0.0, 3.0, 0.0])
+    collided, stops = room.sweep(starts, ends)
+    assert (collided == (ends[:, 1] > 5.0)).all()
+    assert (stops[:, 1] < 5.0).all()
+
+if __name__ == "__main__":
+    test_raycast()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_save_load(pathlib.Path(tmp))
+    test_move_stops_at_wall()
+    test_wind_and_rc_cannot_pass_walls()
+    test_fleet_sweep()
+    print("Obstacle tests passed")
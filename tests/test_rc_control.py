@@ -0,0 +1,63 @@
+# tests/test_rc_control.py
+
+import pytest
+from communication.bridge import TelloBridge
+from communication.commands import CommandHandler
+from communication.scheduler import merge_commands
+from mock_data.clock import VirtualClock
+from mock_data.states import TelloState
+
+def test_rc_command():
+    clock = VirtualClock()
+    tello = TelloState(clock=clock)
+    handler = CommandHandler(tello)
+    
+    assert handler.execute_command('rc', '0 50 0 0')[0] is False   # not flying
+    tello.take_off()
+    assert handler.execute_command('rc', '0 150 0 0')[0] is False  # out of range
+    assert handler.execute_command('rc', '0 50')[0] is False
+    assert handler.execute_command('rc', '0 50 0 100')[0] is True
+    
+    # Half stick forward in slow mode is 2m/s
+    clock.advance(1.0)
+    state = tello.get_state_dict()
+    assert state['y_pos'] == 2.0
+    assert state['yaw_angle'] == 100.0
+    
+    tello.land()
+    clock.advance(1.0)
+    assert tello.get_state_dict()['y_pos'] == 2.0
+
+def test_rc_latest_value_wins():
+    tello = TelloState(clock=VirtualClock())
+    tello.take_off()
+    bridge = TelloBridge(tello)
+    
+    for value in range(10, 60, 10):
+        bridge.set_rc(0, value, 0, 0)
+    assert bridge.flush_rc() == 5
+    assert bridge.flush_rc() is None
+    assert tello.rc == (0, 50, 0, 0)
+    
+    report = bridge.get_rc_latency()
+    assert report['sent'] == 1
+    assert report['superseded'] == 4
+    assert report['max_ms'] >= 0
+    
+    # rc never enters the command queue, it would wait for a reply that never comes
+    assert merge_commands('rc 0 10 0 0', 'rc 0 20 0 0') is None
+    assert bridge.queue_command('rc 0 -20 0 0') == 6
+    assert bridge.command_queue.empty()
+    bridge.flush_rc()
+    assert tello.rc == (0, -20, 0, 0)
+
+    # Out-of-range sticks never reach the rc channel
+    for command in ('rc 0 900 0 0', 'rc 0 0 0'):
+        with pytest.raises(ValueError):
+            bridge.queue_command(command)
+    assert bridge.flush_rc() is None
+
+if __name__ == "__main__":
+    test_rc_command()
+    test_rc_latest_value_wins()
+    print("RC control tests passed")
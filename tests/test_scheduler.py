@@ -0,0 +1,74 @@
+# tests/test_scheduler.py
+
+from communication.scheduler import CommandScheduler, merge_commands
+
+def test_merge_commands():
+    assert merge_commands('forward 100', 'forward 150') == 'forward 250'
+    assert merge_commands('forward 400', 'forward 150') is None  # over 500cm
+    assert merge_commands('forward 100', 'back 100') is None
+    assert merge_commands('cw 90', 'cw 90') == 'cw 180'
+    assert merge_commands('speed 20', 'speed 60') == 'speed 60'
+    assert merge_commands('takeoff', 'takeoff') is None
+    assert merge_commands('forward 10', 'forward 15') is None   # both under 20cm
+
+def test_coalescing_while_busy():
+    scheduler = CommandScheduler()
+    scheduler.put('takeoff')
+    assert scheduler.get_next() == 'takeoff'
+
+    # Drone is busy, so these stay queued and merge
+    scheduler.put('forward 100')
+    scheduler.put('forward 150')
+    scheduler.put('cw 90')
+    assert scheduler.get_next() is None
+
+    scheduler.mark_done()
+    assert scheduler.get_next() == 'forward 250'
+    scheduler.mark_done()
+    assert scheduler.get_next() == 'cw 90'
+    assert scheduler.stats['merged'] == 1
+
+def test_priority_lane():
+    scheduler = CommandScheduler()
+    scheduler.put('forward 100', 'drone1')
+    assert scheduler.get_next('drone1') == 'forward 100'
+
+    scheduler.put('left 50', 'drone1')
+    scheduler.put('stop', 'drone1')
+    # stop goes out even though drone1 is still busy
+    assert scheduler.get_next('drone1') == 'stop'
+
+    # forward finishing doesn't free the drone while stop is still out
+    scheduler.mark_done('drone1')
+    assert scheduler.is_busy('drone1')
+    assert scheduler.get_next('drone1') is None
+    scheduler.mark_done('drone1')
+    assert scheduler.get_next('drone1') == 'left 50'
+
+    scheduler.put('emergency', 'drone1')
+    assert scheduler.get_next('drone1') == 'emergency'
+    assert scheduler.empty('drone1')
+    assert scheduler.stats['dropped'] == 0
+
+def test_ready_across_drones():
+    scheduler = CommandScheduler()
+    scheduler.put('up 50', 'drone1')
+    scheduler.put('down 50', 'drone2')
+    ready = scheduler.get_ready()
+    assert {drone_id: command for drone_id, command, _, _ in ready} == {'drone1': 'up 50', 'drone2': 'down 50'}
+    assert all(enqueued_at <= dequeued_at for _, _, enqueued_at, dequeued_at in ready)
+    assert scheduler.get_ready() == []
+
+    # Separate lanes for separate send threads
+    scheduler.put('forward 50', 'drone3')
+    scheduler.put('land', 'drone1')
+    assert [entry[:2] for entry in scheduler.get_ready(priority=True)] == [('drone1', 'land')]
+    assert scheduler.get_ready(priority=True) == []
+    assert [entry[:2] for entry in scheduler.get_ready(priority=False)] == [('drone3', 'forward 50')]
+
+if __name__ == "__main__":
+    test_merge_commands()
+    test_coalescing_while_busy()
+    test_priority_lane()
+    test_ready_across_drones()
+    print("Scheduler tests passed")
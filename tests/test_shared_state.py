@@ -0,0 +1,107 @@
+# tests/test_shared_state.py
+
+import multiprocessing
+import time
+import numpy as np
+from mock_data.shared_state import SharedStateTable, STATE_FIELDS
+from mock_data.simulation import FleetSimulation
+
+def read_frames(name, reads, result):
+    # Every cell of a frame holds the frame number, so a torn read shows up
+    table = SharedStateTable.attach(name)
+    consistent = True
+    frames = set()
+    for _ in range(reads):
+        try:
+            snapshot = table.snapshot()
+        except TimeoutError:
+            consistent = False
+            continue
+        states = snapshot['states']
+        if not (states == snapshot['frame']).all():
+            consistent = False
+        frames.add(snapshot['frame'])
+    table.close()
+    result.put((consistent, len(frames)))
+
+def test_snapshot_in_process():
+    fleet = FleetSimulation()
+    fleet.add_drone("drone0")
+    fleet.add_drone("drone1")
+    fleet.submit("drone1", "takeoff")
+    table = SharedStateTable.create(4)
+    try:
+        fleet.publish_to(table, period=1.0)
+        fleet.run_until(10)
+        
+        reader = SharedStateTable.attach(table.name)
+        snapshot = reader.snapshot()
+        assert snapshot['ids'] == ["drone0", "drone1"]
+        assert snapshot['timestamp'] == 10.0
+        assert snapshot['frame'] == 11
+        state = reader.get_state_dict("drone1")
+        assert state['is_flying'] is True
+        assert state['height'] == 0.3
+        reader.close()
+    finally:
+        table.close()
+
+def test_publishing_does_not_change_the_run():
+    def run(publish):
+        fleet = FleetSimulation(seed=5)
+        fleet.add_drone("drone0", telemetry_period=5.0)
+        fleet.submit("drone0", "takeoff")
+        table = SharedStateTable.create(1)
+        try:
+            if publish:
+                fleet.publish_to(table, period=0.5)
+            fleet.run_until(120)
+        finally:
+            table.close()
+        return [data for _, event, _, data in fleet.log if event == 'telemetry']
+
+    assert run(publish=False) == run(publish=True)
+
+def test_published_state_advances():
+    fleet = FleetSimulation()
+    fleet.add_drone("drone0")
+    fleet.submit("drone0", "takeoff")
+    table = SharedStateTable.create(1)
+    try:
+        fleet.publish_to(table, period=1.0)
+        fleet.run_until(600)
+        state = table.get_state_dict("drone0")
+        assert state['battery'] < 30
+        assert state['flight_time'] > 590
+    finally:
+        table.close()
+
+def test_cross_process_reads_are_consistent():
+    table = SharedStateTable.create(256)
+    table.set_drones([f"drone{i}" for i in range(256)])
+    context = multiprocessing.get_context('spawn')
+    result = context.Queue()
+    reader = context.Process(target=read_frames, args=(table.name, 2000, result))
+    reader.start()
+    try:
+        # Keep writing until the reader is done
+        frame = np.zeros((256, len(STATE_FIELDS)))
+        i = 0
+        while result.empty() and i < 10_000_000:
+            i += 1
+            frame[:] = i
+            table.publish(frame)
+            time.sleep(0.0001)
+        consistent, distinct_frames = result.get(timeout=30)
+        assert consistent
+        assert distinct_frames > 1
+    finally:
+        reader.join(timeout=30)
+        table.close()
+
+if __name__ == "__main__":
+    test_snapshot_in_process()
+    test_publishing_does_not_change_the_run()
+    test_published_state_advances()
+    test_cross_process_reads_are_consistent()
+    print("Shared state tests passed")
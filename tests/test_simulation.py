@@ -0,0 +1,60 @@
+# tests/test_simulation.py
+
+from mock_data.clock import VirtualClock
+from mock_data.simulation import EventSimulator, FleetSimulation
+from mock_data.states import TelloState
+
+def test_virtual_clock_state():
+    clock = VirtualClock()
+    tello = TelloState(clock=clock)
+    tello.take_off()
+    clock.advance(60)
+    state = tello.get_state_dict()
+    assert state['flight_time'] == 60
+    assert state['battery'] < 100
+
+def test_event_order():
+    simulator = EventSimulator()
+    order = []
+    simulator.schedule(5, order.append, 'b')
+    simulator.schedule(1, order.append, 'a')
+    simulator.schedule(5, order.append, 'c')
+    simulator.run()
+    assert order == ['a', 'b', 'c']
+    assert simulator.clock.time() == 5
+
+def run_fleet():
+    fleet = FleetSimulation(seed=42)
+    for i in range(200):
+        fleet.add_drone(f"drone{i}")
+    fleet.add_drone("reporter", telemetry_period=60)
+    for command in ["takeoff", "forward 100", "forward 100", "cw 90"]:
+        fleet.submit("drone0", command)
+    fleet.submit("reporter", "takeoff")
+
+    # Several hours of simulated time in a few hundred events
+    fleet.run_until(4 * 3600)
+    return fleet
+
+def test_fleet_simulation():
+    fleet = run_fleet()
+    drone0 = fleet.drones["drone0"]
+    assert drone0.y_pos == 2.0
+    assert drone0.yaw_angle == 90
+
+    commands = [entry for entry in fleet.log if entry[1] == 'command' and entry[2] == 'drone0']
+    # takeoff 5s, two 1s moves at 100cm/s, 1s rotation
+    assert [entry[0] for entry in commands] == [5.0, 6.0, 7.0, 8.0]
+
+    battery_events = [entry for entry in fleet.log if entry[1] == 'battery_low']
+    assert {entry[2] for entry in battery_events} == {"drone0", "reporter"}
+    assert fleet.simulator.processed < 500
+
+    # Same seed, same run
+    assert run_fleet().log == fleet.log
+
+if __name__ == "__main__":
+    test_virtual_clock_state()
+    test_event_order()
+    test_fleet_simulation()
+    print("Simulation tests passed")
@@ -0,0 +1,68 @@
+# tests/test_telemetry_store.py
+
+import time
+from communication.bridge import TelloBridge
+from utils.telemetry_store import TelemetryStore
+from utils.visualizer import TelloVisualizer
+from mock_data.clock import VirtualClock
+from mock_data.states import TelloState
+
+def test_rollups():
+    store = TelemetryStore()
+    for i in range(7200):
+        store.add_sample({'height': i % 10, 'battery': 100 - i / 100}, timestamp=float(i))
+
+    # 1 minute span fits 1s buckets
+    series = store.query('height', 60)
+    assert series['resolution'] == 1
+    assert len(series['time']) == 61
+
+    # 1 hour span needs 10s buckets
+    series = store.query('height', 3600)
+    assert series['resolution'] == 10
+    assert series['min'][-1] == 0
+    assert series['max'][-1] == 9
+    assert series['mean'][-1] == 4.5
+
+    # 1 day span uses 1min buckets
+    series = store.query('battery', 86400)
+    assert series['resolution'] == 60
+    assert len(series['time']) == 120
+    assert series['last'][-1] == 100 - 7199 / 100
+
+def test_state_samples():
+    tello = TelloState()
+    store = TelemetryStore()
+    tello.take_off()
+    store.add_sample(tello.get_state_dict(), timestamp=0.0)
+    tello.set_height(2.0)
+    store.add_sample(tello.get_state_dict(), timestamp=0.5)
+
+    series = store.query('height', 10)
+    assert series['max'][0] == 2.0
+    assert series['last'][0] == 2.0
+
+def test_bridge_feeds_store_on_twin_clock():
+    clock = VirtualClock(start=50.0)
+    tello = TelloState(clock=clock)
+    tello.take_off()
+    store = TelemetryStore()
+    TelloBridge(tello, telemetry=store).start_state_monitoring()
+
+    end = time.perf_counter() + 2.0
+    while store.latest_time is None:
+        assert time.perf_counter() < end
+        time.sleep(0.01)
+    assert store.latest_time == 50.0
+    assert store.query('height', 10)['last'][-1] == tello.height
+
+    # Chart time axis is relative to the latest sample, not epoch seconds
+    fig = TelloVisualizer().create_telemetry_chart(store, 'height', 60)
+    assert max(fig.data[-1].x) == 0.0
+    assert fig.layout.xaxis.title.text == 'Time relative to latest sample (s)'
+
+if __name__ == "__main__":
+    test_rollups()
+    test_state_samples()
+    test_bridge_feeds_store_on_twin_clock()
+    print("Telemetry store tests passed")
@@ -0,0 +1,46 @@
+# tests/test_tracing.py
+
+import json
+import pathlib
+import tempfile
+from communication.bridge import TelloBridge
+from mock_data.states import TelloState
+from utils.tracing import Tracer, tracer
+
+def test_disabled_tracer_records_nothing():
+    local = Tracer()
+    with local.span('noop'):
+        pass
+    local.record('noop', 0.0, 1.0)
+    assert local.get_events() == []
+
+def test_command_path_spans(tmp_path):
+    bridge = TelloBridge(TelloState())
+    tracer.clear()
+    tracer.enable()
+    try:
+        bridge.queue_command('takeoff')
+        bridge.queue_command('forward 100')
+        bridge.dispatch_pending()
+        bridge.dispatch_pending()
+    finally:
+        tracer.disable()
+    
+    names = [event['name'] for event in tracer.get_events()]
+    assert names.count('bridge.queue_wait') == 2
+    assert names.count('bridge.send_command') == 2
+    assert names.count('command_handler.execute') == 2
+    assert tracer.summary()['simulator.execute']['count'] == 2
+    assert bridge.response_queue.get()['response']['simulator'] == (True, "Takeoff successful")
+    
+    path = tmp_path / "trace.json"
+    tracer.export(str(path))
+    trace = json.loads(path.read_text())
+    assert all(event['ph'] == 'X' for event in trace['traceEvents'])
+    tracer.clear()
+
+if __name__ == "__main__":
+    test_disabled_tracer_records_nothing()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_command_path_spans(pathlib.Path(tmp))
+    print("Tracing tests passed")
@@ -0,0 +1,76 @@
+# tests/test_trajectory.py
+
+import numpy as np
+from communication.commands import CommandHandler
+from mock_data.clock import VirtualClock
+from mock_data.simulation import FleetSimulation, command_duration
+from mock_data.states import TelloState
+from mock_data.trajectory import ArcTrajectory, LineTrajectory, command_trajectory, preview
+
+def test_go_command():
+    tello = TelloState(clock=VirtualClock())
+    handler = CommandHandler(tello)
+    tello.take_off()
+    
+    assert handler.execute_command('go', '10 10 10 50')[0] is False     # inside 20cm box
+    assert handler.execute_command('go', '600 0 0 50')[0] is False      # out of range
+    assert handler.execute_command('go', '100 0 0 5')[0] is False       # too slow
+    
+    # Body frame: x forward, y left, z up
+    assert handler.execute_command('go', '100 50 70 50')[0] is True
+    assert tello.x_pos == -0.5
+    assert tello.y_pos == 1.0
+    assert round(tello.height, 2) == 1.0
+    assert command_duration(tello, 'go 300 0 400 100') == 5.0
+
+def test_curve_command():
+    tello = TelloState(clock=VirtualClock())
+    handler = CommandHandler(tello)
+    tello.take_off()
+    
+    assert handler.execute_command('curve', '100 0 0 200 0 0 30')[0] is False   # collinear
+    assert handler.execute_command('curve', '100 100 0 200 0 0 80')[0] is False  # too fast
+    assert handler.execute_command('curve', '100 100 0 200 0 0 50')[0] is True
+    assert round(tello.y_pos, 6) == 2.0
+    assert round(tello.x_pos, 6) == 0.0
+    
+    # Semicircle of radius 1m at 50cm/s
+    assert round(command_duration(tello, 'curve 100 100 0 200 0 0 50'), 6) == round(2 * np.pi, 6)
+
+def test_vectorized_fleet_paths():
+    starts = np.zeros((1000, 3))
+    ends = np.random.default_rng(0).uniform(-5, 5, (1000, 3))
+    lines = LineTrajectory(starts, ends, np.ones(1000))
+    positions = lines.evaluate(np.array([0.0, 1e6]))
+    assert positions.shape == (1000, 2, 3)
+    assert np.allclose(positions[:, 1], ends)
+    
+    mids = ends + np.array([1.0, 0.0, 0.0])
+    arcs = ArcTrajectory(starts, mids, ends * 2, np.ones(1000))
+    path = preview(arcs, samples=20)
+    # Every sample sits on its drone's circle
+    distance = np.linalg.norm(path - arcs.center[:, None, :], axis=2)
+    assert np.allclose(distance, arcs.radius[:, None])
+    assert np.allclose(path[:, -1], ends * 2)
+    
+    assert command_trajectory([0, 0, 1], 'forward 100') is None
+
+def test_fleet_flies_go_and_curve():
+    fleet = FleetSimulation()
+    fleet.add_drone("drone0")
+    for command in ["takeoff", "go 100 0 0 50", "curve 100 100 0 200 0 0 50"]:
+        fleet.submit("drone0", command)
+    fleet.run_until(60)
+    
+    results = [data for _, event, _, data in fleet.log if event == 'command']
+    assert all(success for _, success, _ in results), results
+    # takeoff 5s, 2s line, semicircle of 2*pi seconds
+    assert round(fleet.log[-1][0], 6) == round(7 + 2 * np.pi, 6)
+    assert round(fleet.drones["drone0"].y_pos, 6) == 3.0
+
+if __name__ == "__main__":
+    test_go_command()
+    test_curve_command()
+    test_fleet_flies_go_and_curve()
+    test_vectorized_fleet_paths()
+    print("Trajectory tests passed")
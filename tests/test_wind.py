@@ -0,0 +1,60 @@
+# tests/test_wind.py
+
+import pathlib
+import tempfile
+import numpy as np
+from mock_data.clock import VirtualClock
+from mock_data.states import TelloState
+from mock_data.wind import WindField
+
+def test_trilinear_sampling():
+    # Wind growing linearly with x is reproduced exactly between nodes
+    bounds = ((0.0, 4.0), (0.0, 4.0), (0.0, 2.0))
+    field = WindField.uniform([0.0, 0.0, 0.0], bounds=bounds)
+    field.grid[..., 0] = np.arange(5)[:, None, None]
+    
+    positions = np.array([[0.5, 1.0, 1.0], [3.25, 2.5, 0.5], [10.0, 0.0, 0.0]])
+    wind = field.sample(positions)
+    assert np.allclose(wind[:, 0], [0.5, 3.25, 4.0])   # last one clamped to the edge
+    assert np.allclose(wind[:, 1:], 0.0)
+
+def test_gusts_and_profile(tmp_path):
+    field = WindField.from_profile([2.0, 0.0, 0.0])
+    low, high = field.sample([[0, 0, 1.0], [0, 0, 10.0]])
+    assert low[0] < high[0]
+    assert np.isclose(high[0], 2.0)
+    
+    field.set_gusts([0.0, 10.0], [[0, 0, 0], [0, 4, 0]])
+    assert np.isclose(field.sample([[0, 0, 10.0]], t=5.0)[0, 1], 2.0)
+    
+    path = str(tmp_path / "wind.npz")
+    field.save(path)
+    loaded = WindField.load(path)
+    assert np.allclose(loaded.sample([[3, 4, 5]], t=5.0), field.sample([[3, 4, 5]], t=5.0))
+
+def test_move_drifts_with_wind():
+    calm = TelloState(clock=VirtualClock())
+    windy = TelloState(clock=VirtualClock(), wind=WindField.uniform([1.0, 0.0, 0.0]))
+    for tello in (calm, windy):
+        tello.take_off()
+        tello.move('forward', 200)
+    
+    assert calm.x_pos == 0.0
+    # 2s manoeuvre at 100cm/s, 30% of a 1m/s crosswind gets through
+    assert np.isclose(windy.x_pos, 0.6)
+    assert windy.y_pos == 2.0
+
+def test_fleet_sampling_scales():
+    field = WindField.from_profile([3.0, 1.0, 0.0], turbulence=0.5, seed=1)
+    positions = np.random.default_rng(0).uniform([-50, -50, 0], [50, 50, 10], (10000, 3))
+    wind = field.sample(positions, t=0.0)
+    assert wind.shape == (10000, 3)
+    assert np.isfinite(wind).all()
+
+if __name__ == "__main__":
+    test_trilinear_sampling()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_gusts_and_profile(pathlib.Path(tmp))
+    test_move_drifts_with_wind()
+    test_fleet_sampling_scales()
+    print("Wind tests passed")
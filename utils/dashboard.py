@@ -7,11 +7,24 @@ import numpy as np
 import time
 import threading
 from queue import Queue
+from communication.bridge import TelloBridge
+from utils.telemetry_store import TelemetryStore
+from utils.visualizer import TelloVisualizer
+from utils.tracing import tracer
 
 class TelloDashboard:
     def __init__(self, tello_state):
         self.tello = tello_state
         self.command_queue = Queue()
+        
+        # Streamlit reruns the script on every interaction, so the store and
+        # the bridge feeding it live in the session and survive reruns
+        if 'telemetry' not in st.session_state:
+            st.session_state.telemetry = TelemetryStore()
+            st.session_state.bridge = TelloBridge(tello_state, telemetry=st.session_state.telemetry)
+            st.session_state.bridge.start_state_monitoring()
+        self.telemetry = st.session_state.telemetry
+        self.visualizer = TelloVisualizer()
         self.setup_dashboard()
         
     def setup_dashboard(self):
@@ -24,6 +37,7 @@ class TelloDashboard:
             st.header("Digital Twin Control")
             self.setup_command_interface()
             self.setup_state_display()
+            self.setup_telemetry_chart()
             
         with col2:
             st.header("Physical Drone Interface")
@@ -38,7 +52,7 @@ class TelloDashboard:
             ["takeoff", "land", "emergency", "stop"]
         )
         if st.button("Execute Basic Command"):
-            self.command_queue.put(basic_cmd)
+            self.queue_command(basic_cmd)
             
         # Movement Commands
         st.subheader("Movement Control")
@@ -60,7 +74,7 @@ class TelloDashboard:
             
         if st.button("Execute Movement"):
             cmd = f"{direction} {distance}"
-            self.command_queue.put(cmd)
+            self.queue_command(cmd)
             
         # Rotation Control
         st.subheader("Rotation Control")
@@ -74,7 +88,7 @@ class TelloDashboard:
         
         if st.button("Execute Rotation"):
             cmd = f"{rot_dir} {angle}"
-            self.command_queue.put(cmd)
+            self.queue_command(cmd)
             
     def setup_state_display(self):
         st.subheader("Digital Twin State")
@@ -98,6 +112,24 @@ class TelloDashboard:
             st.metric("Vision System", 
                      "Active" if state['vision_system'] else "Inactive")
             
+    def setup_telemetry_chart(self):
+        st.subheader("Telemetry History")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            channel = st.selectbox("Channel", self.telemetry.channels)
+            
+        with col2:
+            spans = {"1 minute": 60, "10 minutes": 600, "1 hour": 3600,
+                     "1 day": 86400, "1 week": 604800}
+            span = spans[st.selectbox("Time Span", list(spans))]
+            
+        fig = self.visualizer.create_telemetry_chart(self.telemetry, channel, span)
+        fig.update_layout(height=300)
+        
+        st.plotly_chart(fig)
+        
     def setup_real_drone_interface(self):
         st.subheader("Real Drone Connection")
         
@@ -143,18 +175,26 @@ class TelloDashboard:
         
         st.plotly_chart(fig)
         
+    def queue_command(self, cmd):
+        # Keep the enqueue time so queue wait shows up in traces
+        self.command_queue.put((cmd, time.perf_counter()))
+        
     def process_commands(self):
         while True:
             if not self.command_queue.empty():
-                cmd = self.command_queue.get()
-                # Process command for both digital twin and real drone
-                # This is where we'll add the bidirectional communication
-                self.execute_command(cmd)
+                with tracer.span('dashboard.poll'):
+                    cmd, enqueued_at = self.command_queue.get()
+                    tracer.record('dashboard.queue_wait', enqueued_at, time.perf_counter(),
+                                  command=cmd)
+                    # Process command for both digital twin and real drone
+                    # This is where we'll add the bidirectional communication
+                    self.execute_command(cmd)
             time.sleep(0.1)
             
     def execute_command(self, cmd):
         # Execute on digital twin
-        response = self.tello.execute_command(cmd)
+        with tracer.span('dashboard.execute', command=cmd):
+            response = self.tello.execute_command(cmd)
         
         # If connected to real drone, execute there too
         # This is where we'll add the real drone communication
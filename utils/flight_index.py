@@ -0,0 +1,290 @@
+# utils/flight_index.py
+
+import math
+import numpy as np
+from collections import defaultdict
+from typing import Dict, Optional, Sequence, Tuple
+
+# Length of the time windows segments are cut into (seconds)
+WINDOW = 10.0
+
+# Size of the horizontal grid cells segment boxes are hashed into (meters)
+CELL_SIZE = 10.0
+
+
+class _Track:
+    """Time-sorted samples of one flight in growable buffers"""
+    def __init__(self):
+        self.times = np.empty(1024)
+        self.positions = np.empty((1024, 3))
+        self.size = 0
+        self.segment = None   # id of the open segment
+
+    def append(self, t: float, position):
+        if self.size and t < self.times[self.size - 1]:
+            raise ValueError(f"Samples must arrive in time order, got {t} after {self.times[self.size - 1]}")
+        if self.size == len(self.times):
+            self.times = np.resize(self.times, 2 * self.size)
+            self.positions = np.resize(self.positions, (2 * self.size, 3))
+        self.times[self.size] = t
+        self.positions[self.size] = position
+        self.size += 1
+
+
+class FlightIndex:
+    """
+    Spatio-temporal index over recorded flights.
+
+    Each track is cut into segments by fixed time windows. Every segment
+    keeps its sample range and bounding box, and closed segments are hashed
+    into a horizontal grid. Point-in-time lookups are a binary search, box
+    queries only touch segments in overlapping cells. When a segment
+    closes it is paired with the closed segments of its window in the same
+    or adjacent cells, so closest-approach searches start from those pairs
+    and compare bounding boxes before looking at samples.
+    Consecutive segments share their boundary sample so interpolation
+    never falls into a gap.
+    """
+    def __init__(self, window: float = WINDOW, cell_size: float = CELL_SIZE):
+        self.window = window
+        self.cell_size = cell_size
+        self.tracks: Dict[str, _Track] = {}
+
+        # Segment table
+        self.seg_track = []
+        self.seg_window = []
+        self.seg_start = []
+        self.seg_end = []          # exclusive
+        self.seg_low = []          # bounding box corners
+        self.seg_high = []
+
+        self.grid = defaultdict(list)               # (cx, cy) -> closed segment ids
+        self.window_grid = defaultdict(list)        # (window, cx, cy) -> closed segment ids
+        self.near_a = []                            # closed segment pairs in neighbouring cells
+        self.near_b = []
+        self.extent = None                          # occupied cells: (x0, y0, x1, y1)
+        self.windows = defaultdict(list)            # window -> segment ids
+        self.open_segments = set()
+
+        # Segment boxes and windows as arrays for closest_approach; rows of
+        # open segments are refreshed when queried
+        self.box_low = np.empty((1024, 3))
+        self.box_high = np.empty((1024, 3))
+        self.box_window = np.empty(1024, dtype=np.int64)
+        self.near_pairs = np.empty((2, 0), dtype=np.int64)
+
+    def record(self, track_id: str, t: float, x: float, y: float, z: float):
+        """Add one sample; samples of a track must arrive in time order"""
+        track = self.tracks.get(track_id)
+        if track is None:
+            track = self.tracks[track_id] = _Track()
+        position = np.array([x, y, z], dtype=float)
+        track.append(t, position)
+        index = track.size - 1
+        window = int(math.floor(t / self.window))
+
+        segment = track.segment
+        if segment is not None and self.seg_window[segment] == window:
+            self.seg_end[segment] = index + 1
+            np.minimum(self.seg_low[segment], position, out=self.seg_low[segment])
+            np.maximum(self.seg_high[segment], position, out=self.seg_high[segment])
+            return
+
+        if segment is not None:
+            # The first sample of the new window also closes the old segment
+            self.seg_end[segment] = index + 1
+            np.minimum(self.seg_low[segment], position, out=self.seg_low[segment])
+            np.maximum(self.seg_high[segment], position, out=self.seg_high[segment])
+            self._close(segment)
+
+        segment = len(self.seg_track)
+        if segment == len(self.box_window):
+            self.box_low = np.resize(self.box_low, (2 * segment, 3))
+            self.box_high = np.resize(self.box_high, (2 * segment, 3))
+            self.box_window = np.resize(self.box_window, 2 * segment)
+        self.box_window[segment] = window
+        self.seg_track.append(track_id)
+        self.seg_window.append(window)
+        self.seg_start.append(index)
+        self.seg_end.append(index + 1)
+        self.seg_low.append(position.copy())
+        self.seg_high.append(position.copy())
+        self.windows[window].append(segment)
+        self.open_segments.add(segment)
+        track.segment = segment
+
+    def record_state(self, track_id: str, state: Dict, t: float):
+        """Add a get_state_dict() sample"""
+        self.record(track_id, t, state['x_pos'], state['y_pos'], state['height'])
+
+    def _close(self, segment: int):
+        self.open_segments.discard(segment)
+        self.box_low[segment] = self.seg_low[segment]
+        self.box_high[segment] = self.seg_high[segment]
+        cells = self._cells(self.seg_low[segment], self.seg_high[segment])
+        window = self.seg_window[segment]
+        neighbours = set()
+        for cx, cy in cells:
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    neighbours.update(self.window_grid.get((window, cx + dx, cy + dy), ()))
+        self.near_a.extend(neighbours)
+        self.near_b.extend([segment] * len(neighbours))
+        for cell in cells:
+            self.grid[cell].append(segment)
+            self.window_grid[(window,) + cell].append(segment)
+        (x0, y0), (x1, y1) = cells[0], cells[-1]
+        if self.extent is not None:
+            x0, y0 = min(x0, self.extent[0]), min(y0, self.extent[1])
+            x1, y1 = max(x1, self.extent[2]), max(y1, self.extent[3])
+        self.extent = (x0, y0, x1, y1)
+
+    def _cells(self, low, high):
+        x0, y0 = (int(math.floor(value / self.cell_size)) for value in low[:2])
+        x1, y1 = (int(math.floor(value / self.cell_size)) for value in high[:2])
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def _query_cells(self, low: np.ndarray, high: np.ndarray):
+        """Occupied grid cells overlapping a box, which may be huge or unbounded"""
+        if self.extent is None:
+            return []
+        # Clip the box to the occupied extent before turning it into cells
+        x0, y0, x1, y1 = self.extent
+        low = np.maximum(low[:2], [x0 * self.cell_size, y0 * self.cell_size])
+        high = np.minimum(high[:2], [(x1 + 1) * self.cell_size, (y1 + 1) * self.cell_size])
+        if (low > high).any():
+            return []
+        cx0, cy0 = (int(math.floor(value / self.cell_size)) for value in low)
+        cx1, cy1 = (int(math.floor(value / self.cell_size)) for value in high)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.grid):
+            return [(cx, cy) for cx, cy in self.grid if cx0 <= cx <= cx1 and cy0 <= cy <= cy1]
+        return self._cells(low, high)
+
+    def _samples(self, segment: int) -> Tuple[np.ndarray, np.ndarray]:
+        track = self.tracks[self.seg_track[segment]]
+        start, end = self.seg_start[segment], self.seg_end[segment]
+        return track.times[start:end], track.positions[start:end]
+
+    def position_at(self, track_id: str, t: float) -> Optional[Tuple[float, float, float]]:
+        """Interpolated position of a track at time t, None outside its recording"""
+        track = self.tracks.get(track_id)
+        if track is None or track.size == 0:
+            return None
+        times = track.times[:track.size]
+        if t < times[0] or t > times[-1]:
+            return None
+        i = int(np.searchsorted(times, t, side='right'))
+        if i >= track.size:
+            return tuple(track.positions[track.size - 1].tolist())
+        t0, t1 = times[i - 1], times[i]
+        f = 0.0 if t1 == t0 else (t - t0) / (t1 - t0)
+        return tuple((track.positions[i - 1] * (1 - f) + track.positions[i] * f).tolist())
+
+    def tracks_in_box(self, low: Sequence[float], high: Sequence[float],
+                      t0: float = -math.inf, t1: float = math.inf) -> Dict[str, float]:
+        """
+        Tracks with a sample inside the box during [t0, t1].
+        Returns: {track_id: first time inside}
+        """
+        low = np.asarray(low, dtype=float)
+        high = np.asarray(high, dtype=float)
+        candidates = set(self.open_segments)
+        for cell in self._query_cells(low, high):
+            candidates.update(self.grid.get(cell, ()))
+
+        entered = {}
+        for segment in sorted(candidates):
+            if (self.seg_low[segment] > high).any() or (self.seg_high[segment] < low).any():
+                continue
+            times, positions = self._samples(segment)
+            inside = ((positions >= low) & (positions <= high)).all(axis=1) & (times >= t0) & (times <= t1)
+            if inside.any():
+                track_id = self.seg_track[segment]
+                first = float(times[np.argmax(inside)])
+                entered[track_id] = min(first, entered.get(track_id, math.inf))
+        return entered
+
+    def closest_approach(self, t0: float = -math.inf,
+                         t1: float = math.inf) -> Optional[Tuple[float, float, str, str]]:
+        """
+        Smallest distance between any two tracks at the same time in [t0, t1].
+        Positions are interpolated onto the union of both tracks' sample times.
+        Returns: (distance, time, track_a, track_b) or None
+        """
+        self._refresh_boxes()
+        windows = self.box_window[:len(self.seg_track)]
+        in_range = ((windows + 1) * self.window >= t0) & (windows * self.window <= t1)
+        best = (math.inf, None, None, None)
+
+        # Closed pairs in neighbouring cells, plus every pair with an open
+        # segment, cover every distance below one cell size
+        a, b = self.near_pairs
+        keep = in_range[a]
+        a, b = [a[keep]], [b[keep]]
+        for window in {self.seg_window[s] for s in self.open_segments}:
+            segments = np.array(self.windows[window])
+            if not in_range[segments[0]]:
+                continue
+            is_open = np.array([s in self.open_segments for s in segments])
+            i, j = np.triu_indices(len(segments), k=1)
+            keep = is_open[i] | is_open[j]
+            a.append(segments[i[keep]])
+            b.append(segments[j[keep]])
+        best = self._closest_pair(np.concatenate(a), np.concatenate(b), t0, t1, best)
+
+        if best[0] >= self.cell_size:
+            # Nothing that close, so pairs in distant cells may hold the minimum
+            for window, segments in self.windows.items():
+                segments = np.array(segments)
+                if len(segments) > 1 and in_range[segments[0]]:
+                    i, j = np.triu_indices(len(segments), k=1)
+                    best = self._closest_pair(segments[i], segments[j], t0, t1, best)
+        return None if best[1] is None else best
+
+    def _refresh_boxes(self):
+        """Copy the boxes of open segments and any new neighbour pairs into the arrays"""
+        for segment in self.open_segments:
+            self.box_low[segment] = self.seg_low[segment]
+            self.box_high[segment] = self.seg_high[segment]
+        paired = self.near_pairs.shape[1]
+        if paired < len(self.near_a):
+            new = np.array([self.near_a[paired:], self.near_b[paired:]], dtype=np.int64)
+            self.near_pairs = np.concatenate([self.near_pairs, new], axis=1)
+
+    def _closest_pair(self, a_idx: np.ndarray, b_idx: np.ndarray, t0: float, t1: float, best):
+        """Check segment pairs in order of their box-gap lower bound until none can beat best"""
+        low, high = self.box_low, self.box_high
+        gap = np.maximum(0.0, np.maximum(low[a_idx] - high[b_idx], low[b_idx] - high[a_idx]))
+        bound = np.sqrt((gap ** 2).sum(axis=1))
+        close = np.flatnonzero(bound < best[0])
+        for i in close[np.argsort(bound[close])]:
+            if bound[i] >= best[0]:
+                break
+            a, b = int(a_idx[i]), int(b_idx[i])
+            result = self._pair_minimum(a, b, t0, t1)
+            if result is not None and result[0] < best[0]:
+                best = (result[0], result[1], self.seg_track[a], self.seg_track[b])
+        return best
+
+    def _pair_minimum(self, a: int, b: int, t0: float, t1: float):
+        times_a, pos_a = self._samples(a)
+        times_b, pos_b = self._samples(b)
+        start = max(times_a[0], times_b[0], t0)
+        end = min(times_a[-1], times_b[-1], t1)
+        if start > end:
+            return None
+        times = np.union1d(times_a, times_b)
+        times = np.concatenate([[start], times[(times > start) & (times < end)], [end]])
+        da = np.stack([np.interp(times, times_a, pos_a[:, k]) for k in range(3)], axis=1)
+        db = np.stack([np.interp(times, times_b, pos_b[:, k]) for k in range(3)], axis=1)
+
+        # Both move linearly between sample times, so solve each interval exactly
+        r0 = (da - db)[:-1]
+        dr = (da - db)[1:] - r0
+        dr_sq = (dr ** 2).sum(axis=1)
+        s = np.clip(-(r0 * dr).sum(axis=1) / np.where(dr_sq > 0, dr_sq, 1.0), 0.0, 1.0)
+        if len(s) == 0:
+            return float(np.linalg.norm(da[0] - db[0])), float(times[0])
+        distance = np.linalg.norm(r0 + s[:, None] * dr, axis=1)
+        i = int(np.argmin(distance))
+        return float(distance[i]), float(times[i] + s[i] * (times[i + 1] - times[i]))
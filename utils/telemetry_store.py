@@ -0,0 +1,143 @@
+# utils/telemetry_store.py
+
+import math
+import time
+import numpy as np
+from typing import Dict, List, Optional
+
+# Numeric channels from TelloState.get_state_dict()
+TELEMETRY_CHANNELS = [
+    'height', 'speed', 'battery', 'flight_time', 'temp_low',
+    'temp_high', 'x_pos', 'y_pos', 'yaw_angle'
+]
+
+# Rollup resolution (seconds) -> number of buckets retained
+ROLLUPS = {
+    1: 3600,       # 1 hour of 1s buckets
+    10: 8640,      # 1 day of 10s buckets
+    60: 10080      # 1 week of 1min buckets
+}
+
+# Most points a query returns before switching to a coarser resolution
+MAX_POINTS = 1000
+
+# Bucket id of a slot that has never been written
+EMPTY_BUCKET = np.iinfo(np.int64).min
+
+
+class Rollup:
+    """
+    Fixed-size ring of time buckets holding min/max/sum/count/last for
+    every channel. A bucket's slot is its index modulo capacity, so adding
+    a sample and locating a bucket are both constant time.
+    """
+    def __init__(self, resolution: float, capacity: int, n_channels: int):
+        self.resolution = resolution
+        self.capacity = capacity
+        self.bucket_id = np.full(capacity, EMPTY_BUCKET, dtype=np.int64)
+        self.min = np.zeros((capacity, n_channels))
+        self.max = np.zeros((capacity, n_channels))
+        self.sum = np.zeros((capacity, n_channels))
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.last = np.zeros((capacity, n_channels))
+        self.latest_id = EMPTY_BUCKET
+
+    def add(self, timestamp: float, values: np.ndarray):
+        """Fold one sample into its bucket"""
+        bucket = int(timestamp // self.resolution)
+        slot = bucket % self.capacity
+
+        if self.bucket_id[slot] != bucket:
+            if bucket < self.bucket_id[slot]:
+                return  # older than the retained window
+            self.bucket_id[slot] = bucket
+            self.min[slot] = values
+            self.max[slot] = values
+            self.sum[slot] = values
+            self.count[slot] = 1
+            self.last[slot] = values
+        else:
+            np.minimum(self.min[slot], values, out=self.min[slot])
+            np.maximum(self.max[slot], values, out=self.max[slot])
+            self.sum[slot] += values
+            self.count[slot] += 1
+            self.last[slot] = values
+        self.latest_id = max(self.latest_id, bucket)
+
+    def query(self, start: float, end: float, channel: int) -> Dict[str, np.ndarray]:
+        """Get the buckets covering [start, end] for one channel"""
+        if self.latest_id == EMPTY_BUCKET:
+            return self._empty()
+        first = max(int(start // self.resolution), self.latest_id - self.capacity + 1)
+        last = min(int(end // self.resolution), self.latest_id)
+        if last < first:
+            ids = np.empty(0, dtype=np.int64)
+        else:
+            ids = np.arange(first, last + 1)
+
+        slots = ids % self.capacity
+        valid = self.bucket_id[slots] == ids
+        slots = slots[valid]
+        count = self.count[slots]
+        return {
+            'time': ids[valid] * self.resolution,
+            'min': self.min[slots, channel],
+            'max': self.max[slots, channel],
+            'mean': self.sum[slots, channel] / count,
+            'last': self.last[slots, channel]
+        }
+
+    def _empty(self) -> Dict[str, np.ndarray]:
+        empty = np.empty(0)
+        return {'time': empty, 'min': empty, 'max': empty, 'mean': empty, 'last': empty}
+
+
+class TelemetryStore:
+    """
+    Multi-resolution time-series store for drone telemetry.
+    Every sample updates the 1s, 10s and 1min rollups incrementally, and
+    queries are answered from the finest rollup that covers the span in
+    at most MAX_POINTS buckets.
+    """
+    def __init__(self, channels: Optional[List[str]] = None,
+                 rollups: Optional[Dict[int, int]] = None,
+                 max_points: int = MAX_POINTS):
+        self.channels = list(channels or TELEMETRY_CHANNELS)
+        self.channel_index = {name: i for i, name in enumerate(self.channels)}
+        self.max_points = max_points
+        self.rollups = [
+            Rollup(resolution, capacity, len(self.channels))
+            for resolution, capacity in sorted((rollups or ROLLUPS).items())
+        ]
+        self.latest_time = None
+
+    def add_sample(self, state: Dict, timestamp: Optional[float] = None):
+        """Add a get_state_dict() sample"""
+        if timestamp is None:
+            timestamp = time.time()
+        values = np.array([float(state.get(name, math.nan)) for name in self.channels])
+        for rollup in self.rollups:
+            rollup.add(timestamp, values)
+        if self.latest_time is None or timestamp > self.latest_time:
+            self.latest_time = timestamp
+
+    def select_rollup(self, span: float) -> Rollup:
+        """Pick the finest rollup that covers the span within max_points"""
+        for rollup in self.rollups:
+            retained = rollup.resolution * rollup.capacity
+            if span / rollup.resolution <= self.max_points and span <= retained:
+                return rollup
+        return self.rollups[-1]
+
+    def query(self, channel: str, span: float,
+              end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Get min/max/mean/last series for a channel over the last span seconds.
+        Returns: dict of arrays plus the resolution used
+        """
+        if end is None:
+            end = self.latest_time if self.latest_time is not None else time.time()
+        rollup = self.select_rollup(span)
+        series = rollup.query(end - span, end, self.channel_index[channel])
+        series['resolution'] = rollup.resolution
+        return series
@@ -0,0 +1,125 @@
+# utils/tracing.py
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Dict, Optional
+
+# Most events kept in memory before the oldest are dropped
+MAX_EVENTS = 100000
+
+_NULL_SPAN = nullcontext()
+
+
+class Span:
+    """Context manager that records one complete trace event"""
+    def __init__(self, tracer, name: str, args: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.record(self.name, self.start, time.perf_counter(), **self.args)
+        return False
+
+
+class Tracer:
+    """
+    Opt-in span recorder for the command path
+    (dashboard -> queue -> bridge -> simulator -> UDP).
+    Spans are exported in the Chrome trace-event format, viewable in
+    chrome://tracing or Perfetto. While disabled, span() returns a shared
+    no-op context so instrumented code pays one attribute check.
+    """
+    def __init__(self, max_events: int = MAX_EVENTS):
+        self.enabled = False
+        self.events = deque(maxlen=max_events)
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """Start recording spans"""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording spans"""
+        self.enabled = False
+
+    def clear(self):
+        """Drop all recorded spans"""
+        with self._lock:
+            self.events.clear()
+
+    def span(self, name: str, **args):
+        """Time a block of code as one span"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, args)
+
+    def record(self, name: str, start: float, end: float, **args):
+        """Record a span from two time.perf_counter() readings"""
+        if not self.enabled:
+            return
+        event = {
+            'name': name,
+            'cat': name.split('.')[0],
+            'ph': 'X',
+            'ts': (start - self.origin) * 1e6,    # microseconds
+            'dur': max(0.0, end - start) * 1e6,
+            'pid': self.pid,
+            'tid': threading.get_ident(),
+            'args': args
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def get_events(self):
+        """Get a copy of the recorded events"""
+        with self._lock:
+            return list(self.events)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, total and mean duration in milliseconds per span name"""
+        totals = {}
+        for event in self.get_events():
+            entry = totals.setdefault(event['name'], {'count': 0, 'total_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] += event['dur'] / 1000
+        for entry in totals.values():
+            entry['mean_ms'] = entry['total_ms'] / entry['count']
+        return totals
+
+    def export(self, path: str):
+        """Write the recorded spans as a Chrome trace-event JSON file"""
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.get_events(), 'displayTimeUnit': 'ms'}, f)
+
+
+# Process-wide tracer shared by dashboard, bridge and command handler
+tracer = Tracer()
+
+
+def traced(name: Optional[str] = None):
+    """Decorator recording a span for each call while tracing is enabled"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
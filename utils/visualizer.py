@@ -6,6 +6,9 @@ import numpy as np
 import threading
 import time
 
+# Default per-drone marker colors, cycled across the fleet
+FLEET_COLORS = ['red', 'blue', 'green', 'orange', 'purple', 'cyan', 'magenta', 'brown']
+
 class TelloVisualizer:
     def __init__(self):
         # Initialize the figure with subplots
@@ -122,7 +125,7 @@ class TelloVisualizer:
             x=self.drone_position['x'],
             y=self.drone_position['y'],
             z=self.drone_position['z'],
-            selector=dict(mode='markers+text')
+            selector=dict(mode='markers+text', name='Drone Position')
         )
         
         # Update trajectory
@@ -130,7 +133,7 @@ class TelloVisualizer:
             x=self.drone_position['history_x'],
             y=self.drone_position['history_y'],
             z=self.drone_position['history_z'],
-            selector=dict(mode='lines')
+            selector=dict(mode='lines', name='Flight Path')
         )
         
         # Update indicators
@@ -144,5 +147,132 @@ class TelloVisualizer:
             selector=dict(title={'text': "Height (m)"})
         )
 
+    def setup_fleet_view(self, drone_ids, colors=None, path_length=50):
+        """
+        Add a multi-drone view: every drone lives in one marker trace and
+        all recent paths in one NaN-separated line trace, so the number of
+        traces stays constant as the fleet grows.
+        """
+        n = len(drone_ids)
+        self.fleet_ids = list(drone_ids)
+        self.fleet_index = {drone_id: i for i, drone_id in enumerate(self.fleet_ids)}
+        if colors is None:
+            colors = [FLEET_COLORS[i % len(FLEET_COLORS)] for i in range(n)]
+        
+        # Path ring buffer per drone, plus one NaN row to break the line
+        self.fleet_path = np.full((n, path_length + 1, 3), np.nan)
+        self.fleet_path_length = path_length
+        self.fleet_path_cursor = 0
+        self.fleet_customdata = np.empty((n, 2), dtype=object)
+        self.fleet_customdata[:, 0] = [str(drone_id) for drone_id in self.fleet_ids]
+        self.fleet_customdata[:, 1] = 0.0
+        
+        # Add fleet markers
+        self.fig.add_trace(
+            go.Scatter3d(
+                x=np.zeros(n), y=np.zeros(n), z=np.zeros(n),
+                mode='markers',
+                marker=dict(size=4, color=colors),
+                customdata=self.fleet_customdata,
+                hovertemplate="%{customdata[0]}<br>yaw: %{customdata[1]:.0f}°<extra></extra>",
+                name='Fleet Positions'
+            ),
+            row=1, col=1
+        )
+        self.fleet_marker_trace = len(self.fig.data) - 1
+        
+        # Add fleet paths
+        self.fig.add_trace(
+            go.Scatter3d(
+                x=[], y=[], z=[],
+                mode='lines',
+                line=dict(color='blue', width=1),
+                connectgaps=False,
+                hoverinfo='skip',
+                name='Fleet Paths'
+            ),
+            row=1, col=1
+        )
+        self.fleet_path_trace = len(self.fig.data) - 1
+        
+    def update_fleet(self, positions, yaw):
+        """
+        Update the whole fleet in one batched call.
+        positions: (N, 3) array of x, y, z in meters, yaw: (N,) degrees
+        """
+        positions = np.asarray(positions, dtype=float)
+        
+        # Append to the path ring buffer
+        cursor = self.fleet_path_cursor % self.fleet_path_length
+        self.fleet_path[:, cursor] = positions
+        self.fleet_path_cursor += 1
+        
+        # Oldest to newest, NaN row last so paths stay separated
+        order = (np.arange(self.fleet_path_length) + self.fleet_path_cursor) % self.fleet_path_length
+        paths = self.fleet_path[:, np.append(order, self.fleet_path_length)].reshape(-1, 3)
+        
+        self.fleet_customdata[:, 1] = np.round(np.asarray(yaw, dtype=float), 1)
+        
+        with self.fig.batch_update():
+            markers = self.fig.data[self.fleet_marker_trace]
+            markers.x = positions[:, 0]
+            markers.y = positions[:, 1]
+            markers.z = positions[:, 2]
+            markers.customdata = self.fleet_customdata
+            
+            path = self.fig.data[self.fleet_path_trace]
+            path.x = paths[:, 0]
+            path.y = paths[:, 1]
+            path.z = paths[:, 2]
+
+    def create_telemetry_chart(self, store, channel, span):
+        # Query the rollup that fits the span
+        series = store.query(channel, span)
+        
+        # Seconds relative to the latest sample, whichever clock stamped them
+        latest = store.latest_time if store.latest_time is not None else 0.0
+        times = series['time'] - latest
+        
+        fig = go.Figure()
+        
+        # Min/max band
+        fig.add_trace(
+            go.Scatter(
+                x=times,
+                y=series['max'],
+                mode='lines',
+                line=dict(width=0),
+                showlegend=False
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=times,
+                y=series['min'],
+                mode='lines',
+                line=dict(width=0),
+                fill='tonexty',
+                name='Min/Max'
+            )
+        )
+        
+        # Mean line
+        fig.add_trace(
+            go.Scatter(
+                x=times,
+                y=series['mean'],
+                mode='lines',
+                line=dict(color='blue', width=2),
+                name='Mean'
+            )
+        )
+        
+        fig.update_layout(
+            title_text=f"{channel} ({series['resolution']}s resolution)",
+            xaxis_title='Time relative to latest sample (s)',
+            yaxis_title=channel
+        )
+        return fig
+
     def show(self):
         self.fig.show()
\ No newline at end of file